@@ -128,6 +128,10 @@ except ImportError:
     
     torch = MockTorch()
 
+# Ultralytics reads its settings from the environment at import time, so configure it first:
+# no per-inference console logging unless the deployment asks for it
+os.environ.setdefault('YOLO_VERBOSE', 'False')
+
 try:
     from ultralytics import YOLO
     YOLO_AVAILABLE = True
@@ -1093,7 +1097,6 @@ def unity_process_injuries():
 import cv2
 import numpy as np
 from ultralytics import YOLO
-import easyocr
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
@@ -1106,6 +1109,7 @@ from pathlib import Path
 import time
 import threading
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import supervision as sv
 
 # Configure Cloudinary
@@ -1121,6 +1125,21 @@ jersey_detector = None
 reader = None
 jersey_mapping_cache = {}
 
+@lru_cache(maxsize=None)
+def get_easyocr_reader(gpu=True):
+    """Return a process-wide EasyOCR reader, building it on first use"""
+    # Import deferred: easyocr pulls in torch
+    import easyocr
+    return easyocr.Reader(['en'], gpu=gpu)
+
+@lru_cache(maxsize=2)
+def get_yolo_model(model_path):
+    """Return a process-wide YOLO model for a weights path, loading the weights on first use"""
+    return YOLO(model_path)
+
+# YOLO predictors are not thread-safe; video threads share the cached model under this lock
+yolo_predict_lock = threading.Lock()
+
 def initialize_models():
     global pose_model, jersey_detector, reader
     
@@ -1147,19 +1166,23 @@ def initialize_models():
         # Get the directory where the script is located
         current_dir = os.path.dirname(os.path.abspath(__file__))
     
-        # Initialize YOLOv8 pose model
-        model_path = os.path.join(current_dir, "yolov8x-pose.pt")
-        if os.path.exists(model_path):
-            pose_model = YOLO(model_path)
-        else:
+        def load_pose_model():
+            # Initialize YOLOv8 pose model
+            model_path = os.path.join(current_dir, "yolov8x-pose.pt")
+            if os.path.exists(model_path):
+                return get_yolo_model(model_path)
             print(f"Warning: Pose model not found at {model_path}, downloading from ultralytics...")
-            pose_model = YOLO("yolov8n-pose.pt")  # Use smaller model to save time
-    
-        # Initialize YOLOv8 object detection model for jersey detection
-        jersey_detector = YOLO("yolov8n.pt")
-    
-        # Initialize OCR reader for jersey numbers
-        reader = easyocr.Reader(['en'])
+            return get_yolo_model("yolov8n-pose.pt")  # Use smaller model to save time
+    
+        # The three loads are independent and mostly spent in torch, which releases the GIL,
+        # so overlap them: pose model, YOLOv8 jersey detector and the OCR reader for jersey numbers
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            pose_future = executor.submit(load_pose_model)
+            jersey_future = executor.submit(get_yolo_model, "yolov8n.pt")
+            reader_future = executor.submit(get_easyocr_reader)
+            pose_model = pose_future.result()
+            jersey_detector = jersey_future.result()
+            reader = reader_future.result()
     
         print("Models initialized successfully")
     except Exception as e:
@@ -1691,8 +1714,7 @@ def process_video(input_path, output_path, athletes_data, sport_type):
         
         # Initialize YOLO model if available
         try:
-            import ultralytics
-            model = ultralytics.YOLO('yolov8n-pose.pt')
+            model = get_yolo_model('yolov8n-pose.pt')
             print("Loaded YOLOv8 pose model")
         except Exception as e:
             print(f"Error loading YOLO model: {e}")
@@ -1798,8 +1820,7 @@ def process_video(input_path, output_path, athletes_data, sport_type):
         
         # Initialize OCR reader for jersey detection
         try:
-            import easyocr
-            reader = easyocr.Reader(['en'], gpu=False)
+            reader = get_easyocr_reader(gpu=False)
             print("Initialized EasyOCR for jersey detection")
             jersey_detector.set_ocr_reader(reader)
         except Exception as e:
@@ -1837,7 +1858,8 @@ def process_video(input_path, output_path, athletes_data, sport_type):
             # Detect poses using YOLO if available
             if model:
                 try:
-                    results = model.predict(frame, conf=0.3, verbose=False)[0]
+                    with yolo_predict_lock:
+                        results = model.predict(frame, conf=0.3, verbose=False)[0]
                     detections = []
                     keypoints_list = []
             
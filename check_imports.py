@@ -3,12 +3,19 @@ Script to check that all necessary imports are available.
 This helps diagnose import errors during deployment.
 """
 
+import argparse
+import importlib.util
 import sys
 import os
 
-def check_imports():
-    """Check that all required modules can be imported."""
-    print("Checking required imports...")
+def check_imports(deep=False):
+    """
+    Check that all required modules are available.
+    By default only locates each module, which is fast and loads nothing; with deep=True each
+    module is actually imported, which also catches broken native dependencies but loads torch,
+    tensorflow and friends into memory.
+    """
+    print("Checking required imports..." if deep else "Locating required modules (use --deep to import them)...")
     
     required_modules = [
         'flask',
@@ -48,7 +55,10 @@ def check_imports():
     missing_modules = []
     for module in required_modules:
         try:
-            __import__(module)
+            if deep:
+                __import__(module)
+            elif importlib.util.find_spec(module) is None:
+                raise ImportError(f"No module named '{module}'")
             print(f"✓ {module}")
         except ImportError as e:
             print(f"✗ {module} - Error: {e}")
@@ -66,5 +76,8 @@ def check_imports():
         return True
 
 if __name__ == "__main__":
-    success = check_imports()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--deep', action='store_true', help="import every module instead of only locating it")
+    args = parser.parse_args()
+    success = check_imports(deep=args.deep)
     sys.exit(0 if success else 1) 
\ No newline at end of file
@@ -1,31 +1,135 @@
+import hashlib
+import json
+import mmap
 import os
 import requests
-import torch
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+# (url, destination) of every model the backend needs
+MODELS = [
+    # YOLOv8x-pose model
+    ("https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov8x-pose.pt", "yolov8x-pose.pt"),
+    # YOLOv8n-pose model (as backup/alternative)
+    ("https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov8n-pose.pt", "yolov8n-pose.pt"),
+    # YOLOv8n model
+    ("https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov8n.pt", "yolov8n.pt"),
+]
+
+# Anything smaller is a placeholder or an interrupted download, not a model
+MIN_MODEL_SIZE = 1000
+
+# Models live next to this script; their absolute paths are resolved once at import
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATHS = {destination: os.path.join(MODEL_DIR, destination) for _, destination in MODELS}
+
+# One pooled HTTP session for all downloads, so connections (and TLS sessions) to the same host are reused
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+# Copy buffer for streaming response bodies to disk
+DOWNLOAD_BUFFER_SIZE = 4 << 20
+
+# Sidecar recording each model's SHA-256 together with the size and mtime it was hashed at
+HASH_CACHE_PATH = os.path.join(MODEL_DIR, '.hash_cache.json')
+
+def snapshot_models(directory=MODEL_DIR):
+    """Map each file name in directory to its stat result, in one scan."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.stat() for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        # Nothing downloaded yet; download_model creates the directory
+        return {}
+
+def check_model(path):
+    """Whether path holds a complete model, from a single stat call."""
+    try:
+        return os.stat(path).st_size >= MIN_MODEL_SIZE
+    except FileNotFoundError:
+        return False
+
+def file_sha256(path):
+    """SHA-256 hex digest of a file, hashed straight from a read-only memory map of it."""
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return hasher.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Hint a single front-to-back pass so the kernel reads ahead aggressively
+            if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            hasher.update(mapped)
+    return hasher.hexdigest()
+
+def load_hash_cache():
+    """Load the digest sidecar, or an empty cache if it is missing or unreadable."""
+    try:
+        with open(HASH_CACHE_PATH, 'rb') as f:
+            return json.loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_hash_cache(hash_cache):
+    """Write the digest sidecar atomically."""
+    temp_path = HASH_CACHE_PATH + '.part'
+    with open(temp_path, 'w') as f:
+        json.dump(hash_cache, f, indent=2)
+    os.replace(temp_path, HASH_CACHE_PATH)
+
+def record_model_digest(destination, hash_cache):
+    """Hash a complete model and record the digest with the stat it was taken at."""
+    path = MODEL_PATHS[destination]
+    stat_result = os.stat(path)
+    hash_cache[destination] = {
+        'size': stat_result.st_size,
+        'mtime_ns': stat_result.st_mtime_ns,
+        'sha256': file_sha256(path),
+    }
+
+def model_is_intact(destination, stat_result, hash_cache):
+    """
+    Whether an existing model file is still the one recorded after its last complete download.
+    Unchanged size and mtime are trusted without hashing; otherwise the file is re-hashed and
+    compared with the recorded digest. Files with no record fall back to the size heuristic.
+    """
+    record = hash_cache.get(destination)
+    if record is None:
+        return stat_result.st_size >= MIN_MODEL_SIZE
+    if record['size'] == stat_result.st_size and record['mtime_ns'] == stat_result.st_mtime_ns:
+        return True
+    if file_sha256(MODEL_PATHS[destination]) != record['sha256']:
+        return False
+    record['size'], record['mtime_ns'] = stat_result.st_size, stat_result.st_mtime_ns
+    return True
 
 def download_model(url, destination):
     """Download a model file if it doesn't already exist."""
     try:
-        # Get the current directory
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        full_destination = os.path.join(current_dir, destination)
+        full_destination = MODEL_PATHS.get(destination) or os.path.join(MODEL_DIR, destination)
         
         print(f"Downloading model from {url} to {full_destination}...")
         
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(full_destination) if os.path.dirname(full_destination) else '.', exist_ok=True)
         
-        # For PyTorch models, we can use torch.hub.download_url_to_file
-        if url.endswith('.pt'):
-            torch.hub.download_url_to_file(url, full_destination)
-        else:
-            # For other files, use requests
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
-            with open(full_destination, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        # Stream the body straight to disk in 4 MiB blocks; no per-block Python callback or progress output.
+        # It goes to a sibling temp file that is renamed into place, so an interrupted download never
+        # leaves a truncated model under the real name
+        temp_destination = full_destination + '.part'
+        try:
+            with SESSION.get(url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(temp_destination, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_BUFFER_SIZE)
+            os.replace(temp_destination, full_destination)
+        finally:
+            if os.path.exists(temp_destination):
+                os.remove(temp_destination)
         
         print(f"Successfully downloaded {full_destination}")
         return True
@@ -37,22 +141,32 @@ if __name__ == "__main__":
     # Print current directory for debugging
     print(f"Current directory: {os.getcwd()}")
     
-    # Download YOLOv8x-pose model
-    download_model(
-        "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov8x-pose.pt",
-        "yolov8x-pose.pt"
-    )
+    # One directory scan tells which models are already present; the digest sidecar tells whether they are intact
+    existing = snapshot_models()
+    hash_cache = load_hash_cache()
+    missing = []
+    for url, destination in MODELS:
+        if destination in existing and model_is_intact(destination, existing[destination], hash_cache):
+            print(f"{destination} already exists, skipping download")
+        else:
+            missing.append((url, destination))
+    
+    # Downloads are network-bound and independent, so overlap them
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            list(executor.map(lambda model: download_model(*model), missing))
     
-    # Download YOLOv8n-pose model (as backup/alternative)
-    download_model(
-        "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov8n-pose.pt",
-        "yolov8n-pose.pt"
-    )
+    # Verify what was just downloaded: one stat per file covers both existence and size
+    failed = [destination for _, destination in missing if not check_model(MODEL_PATHS[destination])]
+    if failed:
+        print(f"Failed to download models: {', '.join(failed)}")
+        sys.exit(1)
     
-    # Download YOLOv8n model
-    download_model(
-        "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov8n.pt",
-        "yolov8n.pt"
-    )
+    # Record digests for new downloads and for models that predate the sidecar
+    downloaded = {destination for _, destination in missing}
+    for _, destination in MODELS:
+        if destination in downloaded or destination not in hash_cache:
+            record_model_digest(destination, hash_cache)
+    save_hash_cache(hash_cache)
     
     print("All models downloaded successfully!") 
\ No newline at end of file
@@ -311,6 +311,15 @@ if parent_dir not in sys.path:
 try:
     from paint_fbx_model import InjuryVisualizer
     
+    # Per-mesh diagnostics are logged at DEBUG; PAINT_FBX_LOG_LEVEL=DEBUG turns them on
+    import logging
+    level_name = os.environ.get('PAINT_FBX_LOG_LEVEL', 'WARNING').upper()
+    log_level = logging.getLevelName(level_name)
+    if not isinstance(log_level, int):
+        print(f"WARNING: Unknown PAINT_FBX_LOG_LEVEL '{{level_name}}', using WARNING")
+        log_level = logging.WARNING
+    logging.basicConfig(level=log_level, format='%(levelname)s: %(message)s')
+    
     # Load injury data
     injury_data = {json.dumps(injury_data)}
     
@@ -413,20 +422,16 @@ except Exception as e:
                 is_cloud_environment = os.environ.get('K_SERVICE') is not None or os.environ.get('CLOUD_RUN') == 'true'
                 print(f"Detected cloud environment: {is_cloud_environment}")
                 
-                # Check if Xvfb is available for headless rendering
-                has_xvfb = False
+                # Check if Xvfb is available for headless rendering (PATH lookups in-process, no `which` subprocess)
+                has_xvfb = shutil.which('xvfb-run') is not None
                 has_xauth = False
-                try:
-                    subprocess.run(['which', 'xvfb-run'], capture_output=True, check=True)
-                    has_xvfb = True
+                if has_xvfb:
                     # Also check if xauth is available
-                    try:
-                        subprocess.run(['which', 'xauth'], capture_output=True, check=True)
-                        has_xauth = True
-                    except (subprocess.SubprocessError, FileNotFoundError):
+                    has_xauth = shutil.which('xauth') is not None
+                    if not has_xauth:
                         print("xauth not found, cannot use xvfb-run")
                     print("Xvfb is available for headless rendering")
-                except (subprocess.SubprocessError, FileNotFoundError):
+                else:
                     print("Xvfb not found, will try direct Blender execution")
                 
                 try:
@@ -29,6 +29,32 @@ class JerseyDetector:
         """Set the OCR reader instance."""
         self.reader = reader
     
+    def _match_jersey_number(self, text, valid_jersey_numbers):
+        """Return the valid jersey number an OCR text resolves to, or None."""
+        # Clean the text (remove non-numeric characters)
+        cleaned_text = ''.join(c for c in text if c.isdigit())
+        
+        # Skip if no digits were found
+        if not cleaned_text:
+            return None
+        
+        # Try different formats (with/without leading zeros)
+        # Direct match
+        if cleaned_text in valid_jersey_numbers:
+            return cleaned_text
+        
+        # Try with leading zeros
+        for jersey in valid_jersey_numbers:
+            if jersey.endswith(cleaned_text):
+                return jersey
+        
+        # Try without leading zeros
+        for jersey in valid_jersey_numbers:
+            if jersey.lstrip('0') == cleaned_text:
+                return jersey
+        
+        return None
+    
     def detect_jerseys(self, frame, detections, keypoints_list, athletes_data, frame_count):
         """
         Detect jersey numbers in the frame and associate them with tracked athletes.
@@ -125,59 +151,36 @@ class JerseyDetector:
                     if jersey_region.shape[0] < 20 or jersey_region.shape[1] < 20:
                         continue
                     
-                    # Enhance the jersey region for better OCR
-                    # Convert to grayscale
-                    gray = cv2.cvtColor(jersey_region, cv2.COLOR_BGR2GRAY)
-                    
-                    # Apply adaptive thresholding
-                    thresh = cv2.adaptiveThreshold(
-                        gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-                        cv2.THRESH_BINARY_INV, 11, 2
-                    )
-                    
-                    # Try to detect text in both the original and enhanced images
+                    # Try the original image first, and only fall back to the
+                    # enhanced image when it yields no valid jersey number
                     results = []
                     try:
                         if self.reader:
                             # Try with the original image
                             results.extend(self.reader.readtext(jersey_region))
                             
-                            # Try with the enhanced image
-                            results.extend(self.reader.readtext(thresh))
+                            if not any(self._match_jersey_number(text, valid_jersey_numbers)
+                                       for _, text, _ in results):
+                                # Enhance the jersey region for better OCR
+                                # Convert to grayscale
+                                gray = cv2.cvtColor(jersey_region, cv2.COLOR_BGR2GRAY)
+                                
+                                # Apply adaptive thresholding
+                                thresh = cv2.adaptiveThreshold(
+                                    gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
+                                    cv2.THRESH_BINARY_INV, 11, 2
+                                )
+                                
+                                # Try with the enhanced image
+                                results.extend(self.reader.readtext(thresh))
                     except Exception as e:
                         print(f"OCR error: {e}")
                         continue
                     
                     # Process the OCR results
                     for (bbox, text, prob) in results:
-                        # Clean the text (remove non-numeric characters)
-                        cleaned_text = ''.join(c for c in text if c.isdigit())
-                        
-                        # Skip if no digits were found
-                        if not cleaned_text:
-                            continue
-                        
                         # Check if the detected number matches any of our valid jersey numbers
-                        # Try different formats (with/without leading zeros)
-                        matched_jersey = None
-                        
-                        # Direct match
-                        if cleaned_text in valid_jersey_numbers:
-                            matched_jersey = cleaned_text
-                        
-                        # Try with leading zeros
-                        elif any(jersey.endswith(cleaned_text) for jersey in valid_jersey_numbers):
-                            for jersey in valid_jersey_numbers:
-                                if jersey.endswith(cleaned_text):
-                                    matched_jersey = jersey
-                                    break
-                        
-                        # Try without leading zeros
-                        elif any(jersey.lstrip('0') == cleaned_text for jersey in valid_jersey_numbers):
-                            for jersey in valid_jersey_numbers:
-                                if jersey.lstrip('0') == cleaned_text:
-                                    matched_jersey = jersey
-                                    break
+                        matched_jersey = self._match_jersey_number(text, valid_jersey_numbers)
                         
                         # If we found a match
                         if matched_jersey:
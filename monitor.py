@@ -10,6 +10,8 @@ import time
 import subprocess
 import logging
 import signal
+import select
+import threading
 import psutil
 
 # Configure logging
@@ -24,29 +26,102 @@ logging.basicConfig(
 logger = logging.getLogger("worker_monitor")
 
 GUNICORN_MASTER_PROCESS_NAME = "gunicorn: master"
+GUNICORN_WORKER_PROCESS_NAME = "gunicorn: worker"
 CHECK_INTERVAL = 30  # seconds
 RESTART_DELAY = 5  # seconds
+STARTUP_TIMEOUT = 10  # seconds to wait for a restarted server to come up
+STARTUP_POLL_INTERVAL = 0.5  # seconds
 MAX_MEMORY_PERCENT = 80  # Restart if memory usage exceeds this percentage
 MAX_RESTARTS = 5  # Maximum number of restarts before giving up
+MEMORY_CHECK_EVERY = 4  # Full worker sweep every Nth cycle while membership is stable
+FULL_CHECK_MAX_AGE = 300  # seconds before a full sweep is forced regardless
 
 class WorkerMonitor:
     def __init__(self):
         self.server_start_time = time.time()
         self.restart_count = 0
         self.last_restart_time = 0
+        self.script_path = "/app/start_server.sh"
+        if not os.path.exists(self.script_path):
+            self.script_path = "./start_server.sh"
+        # Cached result of the last full worker sweep
+        self._last_membership = None
+        self._last_full_check = 0
+        self._check_count = 0
+        # Server processes this monitor spawned; only these are reaped
+        self._spawned = []
+        # Set when a child process changes state so the loop wakes early
+        self._child_event = threading.Event()
+        signal.signal(signal.SIGCHLD, self._handle_sigchld)
+        
+    def _handle_sigchld(self, signum, frame):
+        """Reap exited servers we spawned and wake the monitoring loop"""
+        # poll() reaps only its own PID, leaving other children's exit status intact
+        self._spawned = [proc for proc in self._spawned if proc.poll() is None]
+        self._child_event.set()
+        
+    def _wait_for_next_check(self):
+        """Sleep until the next check, waking early if the known master exits"""
+        # Catch a spawned server that exited before it was recorded
+        self._handle_sigchld(None, None)
+        
+        # SIGCHLD only covers servers we spawned, so block on a pidfd for the
+        # master (Linux 5.3+); it becomes readable when the process exits
+        pidfd = None
+        if self._last_membership is not None and hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(self._last_membership[0])
+            except OSError:
+                pidfd = None
+        
+        if pidfd is None:
+            self._child_event.wait(timeout=CHECK_INTERVAL)
+            return
+        
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            if poller.poll(CHECK_INTERVAL * 1000):
+                logger.info("Gunicorn master exited, checking now")
+        finally:
+            os.close(pidfd)
+        
+    def _cache_is_fresh(self):
+        """Whether the last full sweep can stand in for this cycle"""
+        return (time.time() - self._last_full_check < FULL_CHECK_MAX_AGE
+                and self._check_count % MEMORY_CHECK_EVERY != 0)
+    
+    def _can_skip_sweep(self):
+        """Cheap probe: the last known master is still alive"""
+        if self._last_membership is None:
+            return False
+        if not self._cache_is_fresh():
+            return False
+        try:
+            master = psutil.Process(self._last_membership[0])
+            return master.status() not in ['zombie', 'dead']
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
         
     def find_gunicorn_processes(self):
         """Find all gunicorn processes"""
         master_pid = None
         worker_pids = []
         
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        # psutil >= 6.0 no longer does a PID-reuse check per process here
+        for proc in psutil.process_iter(['pid', 'cmdline']):
             try:
+                cmdline = proc.info['cmdline']
+                if not cmdline:
+                    continue
+                # Gunicorn writes its role into argv[0] via setproctitle; join the
+                # pieces since psutil may split an overrun title on spaces
+                title = cmdline[0] if len(cmdline) == 1 else " ".join(cmdline)
                 # Check for the master process
-                if "gunicorn: master" in " ".join(proc.info['cmdline'] or []):
+                if title.startswith(GUNICORN_MASTER_PROCESS_NAME):
                     master_pid = proc.info['pid']
                 # Check for worker processes
-                elif "gunicorn: worker" in " ".join(proc.info['cmdline'] or []):
+                elif title.startswith(GUNICORN_WORKER_PROCESS_NAME):
                     worker_pids.append(proc.info['pid'])
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 pass
@@ -56,6 +131,13 @@ class WorkerMonitor:
     def check_worker_health(self):
         """Check if workers are healthy"""
         try:
+            self._check_count += 1
+            woken = self._child_event.is_set()
+            self._child_event.clear()
+            if not woken and self._can_skip_sweep():
+                logger.info("Gunicorn master unchanged and alive, skipping worker sweep")
+                return True
+            
             master_pid, worker_pids = self.find_gunicorn_processes()
             
             if not master_pid:
@@ -68,19 +150,29 @@ class WorkerMonitor:
                 
             logger.info(f"Found gunicorn master (PID: {master_pid}) and {len(worker_pids)} workers")
             
+            # Skip the per-worker sweep on most cycles while membership is stable
+            membership = (master_pid, tuple(sorted(worker_pids)))
+            if membership == self._last_membership and self._cache_is_fresh():
+                return True
+            
             # Check memory usage of workers
             for pid in worker_pids:
                 try:
-                    worker = psutil.Process(pid)
-                    memory_percent = worker.memory_percent()
+                    # One /proc read batch per worker instead of separate calls
+                    info = psutil.Process(pid).as_dict(attrs=['memory_percent', 'status'])
+                    memory_percent = info['memory_percent']
+                    status = info['status']
+                    
+                    if memory_percent is None or status is None:
+                        raise psutil.AccessDenied(pid)
                     
                     if memory_percent > MAX_MEMORY_PERCENT:
                         logger.warning(f"Worker (PID: {pid}) using excessive memory: {memory_percent:.1f}%")
                         return False
                         
                     # Check if the worker is responding (simplified check - just see if it's running)
-                    if worker.status() in ['zombie', 'dead']:
-                        logger.warning(f"Worker (PID: {pid}) is in a bad state: {worker.status()}")
+                    if status in ['zombie', 'dead']:
+                        logger.warning(f"Worker (PID: {pid}) is in a bad state: {status}")
                         return False
                         
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -88,6 +180,8 @@ class WorkerMonitor:
                     return False
             
             # All checks passed
+            self._last_membership = membership
+            self._last_full_check = time.time()
             return True
             
         except Exception as e:
@@ -129,16 +223,22 @@ class WorkerMonitor:
         # Start a new server instance
         logger.info("Starting new server instance...")
         try:
-            script_path = "/app/start_server.sh"
-            if not os.path.exists(script_path):
-                script_path = "./start_server.sh"
-                
-            # Run the server in the background
-            subprocess.Popen(script_path, shell=True)
+            # Run the server in the background, detached from our session; it
+            # inherits our stdout/stderr so its access and error logs still reach the platform
+            self._spawned.append(subprocess.Popen(
+                [self.script_path],
+                start_new_session=True,
+                close_fds=True
+            ))
             logger.info("New server instance started")
             
-            # Wait for it to initialize
-            time.sleep(10)
+            # Wait for it to initialize, returning as soon as the master is up
+            deadline = time.time() + STARTUP_TIMEOUT
+            while time.time() < deadline:
+                time.sleep(STARTUP_POLL_INTERVAL)
+                master_pid, _ = self.find_gunicorn_processes()
+                if master_pid:
+                    break
             return True
             
         except Exception as e:
@@ -157,9 +257,8 @@ class WorkerMonitor:
                     if not self.restart_server():
                         logger.error("Failed to restart server. Monitoring will continue.")
                 
-                # Sleep before next check
-                logger.info(f"Sleeping for {CHECK_INTERVAL} seconds")
-                time.sleep(CHECK_INTERVAL)
+                logger.info(f"Waiting up to {CHECK_INTERVAL} seconds for next check")
+                self._wait_for_next_check()
                 
             except KeyboardInterrupt:
                 logger.info("Monitor shutting down")
@@ -1,16 +1,23 @@
 import bpy
 import json
+import logging
 import os
+import re
 import sys
 from pathlib import Path
 import mathutils
 import math
+import numpy as np
 import datetime
-import time
 import argparse
 import traceback
+from collections import namedtuple
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 
+# Per-mesh diagnostics are logged at DEBUG level, so they are only formatted when enabled
+logger = logging.getLogger(__name__)
+
 # Import our new AI service
 try:
     from anatomical_ai_service import AnatomicalAIService
@@ -30,6 +37,33 @@ except ImportError:
                     matches.append(mesh)
             return matches
 
+def _build_term_index(mapping):
+    """Invert a {key: [terms]} mapping into {term: (key positions...)} in mapping order"""
+    index = {}
+    for position, terms in enumerate(mapping.values()):
+        for term in terms:
+            positions = index.setdefault(term, [])
+            if position not in positions:
+                positions.append(position)
+    return {term: tuple(positions) for term, positions in index.items()}
+
+@lru_cache(maxsize=256)
+def _compile_alternation(terms):
+    """Compile a tuple of literal terms into one regex alternation, or None if there are none"""
+    if not terms:
+        return None
+    return re.compile('|'.join(map(re.escape, terms)))
+
+def _charset_bitmap(text):
+    """Bitmap of the distinct characters in text (bit n set for chr(n)), ignoring spaces"""
+    bits = 0
+    for char in set(text):
+        bits |= 1 << ord(char)
+    return bits & ~(1 << ord(' '))
+
+# Per-mesh data that does not change while injuries are painted, snapshotted once per scene
+MeshInfo = namedtuple('MeshInfo', ['obj', 'name', 'name_lower', 'region', 'center', 'max_dim', 'char_bits', 'x', 'volume'])
+
 class InjuryVisualizer:
     INJURY_COLORS = {
         'active': (1.0, 0.0, 0.0, 1.0),     # Red for active injuries
@@ -37,6 +71,13 @@ class InjuryVisualizer:
         'recovered': (0.0, 1.0, 0.0, 1.0),  # Green for recovered injuries
     }
     
+    # How each status color is reported in the logs
+    _INJURY_COLOR_LABELS = {
+        'active': 'ACTIVE color (RED)',
+        'past': 'PAST color (ORANGE)',
+        'recovered': 'RECOVERED color (GREEN)',
+    }
+    
     SEVERITY_ALPHA = {
         'mild': 0.85,
         'moderate': 0.95,
@@ -72,9 +113,10 @@ class InjuryVisualizer:
         'apply_xray_before_injuries': True   # Whether to apply x-ray before injury colors
     }
     
-    # Updated list of specific outer meshes that should always be made transparent
-    OUTER_MESHES = [
-        # Original meshes
+    # Specific outer meshes that should always be made transparent. Only the stems are
+    # listed: the model's left/right variants carry an 'l'/'r' suffix on these names.
+    # Sorted longest first so substring scans report the most specific entry
+    OUTER_MESHES = sorted([
         'Deltoid_fascia',
         'Brachial_fascia',
         'Antebrachial_fascia',
@@ -94,7 +136,6 @@ class InjuryVisualizer:
         'Zygomaticus_minor_muscle',
         'Risorius_muscle',
         'orbicularis_oris_muscle',
-        'Platysma',
         'Masseteric_fascia',
         'Depressor_anguli_oris',
         'Buchinator',
@@ -106,72 +147,17 @@ class InjuryVisualizer:
         'Ilitibial_tract',
         'Popliteal_fascia',
         'Crucal_fascia',
-        'Subcutaneous_calcaneal_bursa',
-        
-        # Additional meshes with exact names as provided by user
-        'Deltoid_fascial',
-        'Deltoid_fasciar',
-        'Brachial_fascial',
-        'Brachial_fasciar',
-        'Antebrachial_fascial',
-        'Antebrachial_fasciar',
-        'Palmar_aponeurosisl',
-        'Palmar_aponeurosisr',
-        'Platysmal',
-        'Platysmar',
-        'Pectoral_fascial',
-        'Pectoral_fasciar',
-        'Investing_abdominal_fascial',
-        'Investing_abdominal_fasciar',
-        'Fascia_latal',
-        'Fascia_latar',
-        'Crural_fascial',
-        'Crural_fasciar',
-        'subcutaneous_prepatellar_bursal',
-        'subcutaneous_prepatellar_bursar',
-        'subcutaneous_infrapatellar_bursal',
-        'subcutaneous_infrapatellar_bursar',
-        'subcutaneous_bursa_of_tuberosity_of_tibial',
-        'subcutaneous_bursa_of_tuberosity_of_tibiar',
-        'superior_fibular_retinaculuml',
-        'superior_fibular_retinaculumr',
-        'Epicranial_aponeurosisl',
-        'Epicranial_aponeurosisr',
-        'Frontalis_musclel',
-        'Frontalis_muscler',
-        'Temporoparietalis_musclel',
-        'Temporoparietalis_muscler',
-        'Zygomaticus_minor_musclel',
-        'Zygomaticus_minor_muscler',
-        'Risorius_musclel',
-        'Risorius_muscler',
-        'orbicularis_oris_musclel',
-        'orbicularis_oris_muscler',
-        'Masseteric_fascial',
-        'Masseteric_fasciar',
-        'Depressor_anguli_orisl',
-        'Depressor_anguli_orisr',
-        'Buchinatorl',
-        'Buchinatorr',
-        'Zygomaticus_major_musclel',
-        'Zygomaticus_major_muscler',
-        'Superficial_investing_cervical_fascial',
-        'Superficial_investing_cervical_fasciar',
-        'OCcipitalis_musclel',
-        'OCcipitalis_muscler',
-        'Procerus_musclel',
-        'Procerus_muscler',
-        'Dorsa_fascia_of_handl',
-        'Dorsa_fascia_of_handr',
-        'Ilitibial_tractl',
-        'Ilitibial_tractr',
-        'Popliteal_fascial',
-        'Popliteal_fasciar',
-        'Crucal_fascial',
-        'Crucal_fasciar',
-        'Subcutaneous_calcaneal_bursal',
-        'Subcutaneous_calcaneal_bursar'
-    ]
+        'Subcutaneous_calcaneal_bursa'
+    ], key=len, reverse=True)
+    
+    # Lower-cased OUTER_MESHES, computed once at import
+    _OUTER_MESHES_LOWER = tuple(map(str.lower, OUTER_MESHES))
+    _OUTER_MESH_SET = frozenset(_OUTER_MESHES_LOWER)
+    
+    # OUTER_MESHES matchers built once: a single alternation for "entry in name"
+    # and a newline-joined blob (including l/r variants) for the reverse "name in entry" test
+    _OUTER_MESH_PATTERN = re.compile('|'.join(map(re.escape, _OUTER_MESHES_LOWER)))
+    _OUTER_MESH_BLOB = '\n'.join(stem + suffix for stem in _OUTER_MESHES_LOWER for suffix in ('', 'l', 'r'))
     
     # Specific body part mappings to ensure correct mesh selection
     BODY_PART_MESH_MAPPING = {
@@ -269,13 +255,188 @@ class InjuryVisualizer:
         ]
     }
     
+    # Exact mesh names per body part, used by _get_exact_injury_meshes
+    EXACT_INJURY_MESH_MAPPING = {
+        'shoulder': [
+            'Deltoid', 'Supraspinatus', 'Infraspinatus', 'Teres minor', 
+            'Subscapularis', 'Acromial part of deltoid muscle'
+        ],
+        'arm': [
+            'Biceps brachii', 'Triceps brachii', 'Brachialis', 'Brachioradialis'
+        ],
+        'foot': [
+            'Extensor digitorum brevis', 'Extensor hallucis brevis', 'Abductor hallucis',
+            'Flexor digitorum brevis', 'Abductor digiti minimi of foot'
+        ],
+        'ankle': [
+            'Tibialis anterior', 'Tibialis posterior', 'Fibularis longus', 
+            'Fibularis brevis', 'Calcaneal tendon'
+        ],
+        'knee': [
+            'Rectus femoris', 'Vastus lateralis', 'Vastus medialis', 'Vastus intermedius',
+            'Patellar retinaculum'
+        ],
+        'wrist': [
+            'Flexor carpi radialis', 'Flexor carpi ulnaris', 'Extensor carpi radialis',
+            'Extensor carpi ulnaris'
+        ],
+        'hand': [
+            'Abductor pollicis brevis', 'Opponens pollicis', 'Flexor pollicis brevis',
+            'Adductor pollicis', 'Abductor digiti minimi of hand'
+        ],
+        'neck': [
+            'Sternocleidomastoid', 'Trapezius', 'Longus colli', 'Longus capitis'
+        ],
+        'back': [
+            'Erector spinae', 'Multifidus', 'Quadratus lumborum', 'Latissimus dorsi'
+        ],
+        'hip': [
+            'Gluteus maximus', 'Gluteus medius', 'Gluteus minimus', 'Piriformis',
+            'Tensor fasciae latae'
+        ]
+    }
+    
+    # Related anatomical terms for common body parts
+    ANATOMICAL_MAPPINGS = {
+        'biceps': ['bicep', 'biceps', 'brachii', 'arm', 'upper arm'],
+        'triceps': ['tricep', 'triceps', 'brachii', 'arm', 'upper arm'],
+        'deltoid': ['deltoid', 'shoulder', 'delt'],
+        'gastrocnemius': ['gastrocnemius', 'calf', 'leg', 'gastroc', 'soleus'],
+        'quadriceps': ['quad', 'quadricep', 'quadriceps', 'thigh', 'femur', 'leg', 'anterior', 'femoral', 'vastus'],
+        'hamstring': ['hamstring', 'thigh', 'leg', 'posterior', 'femur', 'biceps femoris'],
+        'pectoralis': ['pec', 'chest', 'pectoral', 'pectoralis'],
+        'latissimus': ['lat', 'back', 'latissimus', 'dorsi'],
+        'trapezius': ['trap', 'back', 'trapezius', 'shoulder'],
+        'gluteus': ['glute', 'buttock', 'gluteus', 'maximus'],
+        'abdominals': ['abs', 'abdomen', 'rectus', 'abdominis'],
+        'shoulder': ['shoulder', 'deltoid', 'rotator', 'cuff', 'supraspinatus', 'infraspinatus', 'teres'],
+        'knee': ['knee', 'patella', 'leg', 'joint'],
+        'ankle': ['ankle', 'foot', 'tarsal', 'joint'],
+        'wrist': ['wrist', 'hand', 'carpal', 'joint'],
+        'elbow': ['elbow', 'arm', 'joint', 'ulnar'],
+        'hip': ['hip', 'pelvis', 'joint', 'iliac'],
+        'neck': ['neck', 'cervical', 'spine'],
+        'back': ['back', 'spine', 'vertebra', 'lumbar', 'thoracic'],
+        'chest': ['chest', 'thorax', 'rib', 'pectoral', 'sternum'],
+        'arm': ['arm', 'humerus', 'bicep', 'tricep', 'brachial', 'brachii'],
+        'forearm': ['forearm', 'radius', 'ulna', 'wrist'],
+        'thigh': ['thigh', 'femur', 'quadricep', 'quadriceps', 'quad', 'hamstring', 'femoral'],
+        'leg': ['leg', 'tibia', 'fibula', 'calf', 'shin', 'gastrocnemius'],
+        'foot': ['foot', 'toe', 'metatarsal', 'calcaneus', 'heel', 'plantar', 'tarsal', 'phalanges', 'digit', 'hallux', 'talus', 'navicular', 'cuboid', 'cuneiform', 'interossei'],
+        'upper arm': ['bicep', 'tricep', 'brachii', 'humerus', 'arm', 'upper arm', 'brachialis'],
+        'calf': ['calf', 'gastrocnemius', 'soleus', 'leg', 'lower leg', 'achilles']
+    }
+    
+    # Reverse index: related term -> positions of the ANATOMICAL_MAPPINGS keys listing it
+    _RELATED_TERM_INDEX = _build_term_index(ANATOMICAL_MAPPINGS)
+    
+    # Body region keywords matched against mesh names, in priority order
+    MESH_REGION_KEYWORDS = {
+        'head': ['head', 'skull', 'cranium', 'face', 'jaw', 'mandible'],
+        'neck': ['neck', 'cervical'],
+        'shoulder': ['shoulder', 'clavicle', 'scapula'],
+        'arm': ['arm', 'humerus', 'bicep', 'tricep', 'brachii'],
+        'elbow': ['elbow'],
+        'forearm': ['forearm', 'radius', 'ulna'],
+        'wrist': ['wrist', 'carpal'],
+        'hand': ['hand', 'finger', 'thumb', 'palm', 'metacarpal', 'phalanx'],
+        'chest': ['chest', 'thorax', 'thoracic', 'pectoral', 'sternum', 'rib'],
+        'abdomen': ['abdomen', 'abdominal', 'stomach', 'belly'],
+        'back': ['back', 'spine', 'spinal', 'vertebra', 'vertebrae', 'lumbar'],
+        'hip': ['hip', 'pelvis', 'pelvic', 'ilium', 'iliac'],
+        'thigh': ['thigh', 'femur', 'quadricep', 'quadriceps', 'quad', 'hamstring', 'femoral'],
+        'knee': ['knee', 'patella', 'patellar'],
+        'leg': ['leg', 'shin', 'calf', 'tibia', 'fibula', 'gastrocnemius'],
+        'ankle': ['ankle', 'tarsal'],
+        'foot': ['foot', 'feet', 'toe', 'metatarsal', 'calcaneus', 'heel']
+    }
+    
+    # Body region terms matched against injury body part names, in priority order
+    BODY_REGION_TERMS = {
+        'head': ['head', 'skull', 'face', 'jaw', 'cranium', 'brain'],
+        'neck': ['neck', 'cervical', 'throat'],
+        'shoulder': ['shoulder', 'deltoid', 'rotator cuff', 'clavicle', 'scapula'],
+        'arm': ['arm', 'bicep', 'tricep', 'humerus', 'brachii', 'upper arm'],
+        'elbow': ['elbow', 'olecranon'],
+        'forearm': ['forearm', 'radius', 'ulna', 'wrist'],
+        'hand': ['hand', 'finger', 'thumb', 'palm', 'wrist'],
+        'chest': ['chest', 'pectoral', 'thorax', 'rib', 'sternum'],
+        'abdomen': ['abdomen', 'stomach', 'abs', 'core'],
+        'back': ['back', 'spine', 'vertebra', 'lumbar', 'thoracic'],
+        'hip': ['hip', 'pelvis', 'iliac', 'sacrum'],
+        'thigh': ['thigh', 'quadricep', 'hamstring', 'femur', 'upper leg'],
+        'knee': ['knee', 'patella', 'meniscus'],
+        'leg': ['leg', 'calf', 'shin', 'tibia', 'fibula', 'gastrocnemius', 'lower leg'],
+        'ankle': ['ankle', 'talus', 'calcaneus'],
+        'foot': ['foot', 'toe', 'heel', 'metatarsal', 'plantar', 'tarsal', 'phalanges', 'digit', 'hallux', 'navicular', 'cuboid', 'cuneiform', 'interossei']
+    }
+    
+    # One compiled alternation per region, so each region costs a single scan
+    _MESH_REGION_PATTERNS = tuple(
+        (region, re.compile('|'.join(map(re.escape, keywords))))
+        for region, keywords in MESH_REGION_KEYWORDS.items()
+    )
+    _REGION_IDS = {region: i for i, region in enumerate(MESH_REGION_KEYWORDS)}
+    _BODY_REGION_PATTERNS = tuple(
+        (region, re.compile('|'.join(map(re.escape, terms))))
+        for region, terms in BODY_REGION_TERMS.items()
+    )
+    
+    # Meshes to skip for foot/ankle injuries (hand terms) and hand/wrist injuries (foot terms),
+    # each compiled into one alternation so a mesh name is scanned once
+    HAND_EXCLUSION_TERMS = ['hand', 'palmar', 'pollicis', 'carpal', 'carpus', 'metacarpal']
+    FOOT_EXCLUSION_TERMS = ['foot', 'plantar', 'hallucis', 'tarsal', 'tarsus', 'metatarsal']
+    _HAND_EXCLUSION_PATTERN = re.compile('|'.join(map(re.escape, HAND_EXCLUSION_TERMS)))
+    _FOOT_EXCLUSION_PATTERN = re.compile('|'.join(map(re.escape, FOOT_EXCLUSION_TERMS)))
+    
+    # Exclusion rules as (body part trigger, meshes to exclude, description), in priority order
+    _EXCLUSION_RULES = (
+        (re.compile('foot|ankle'), _HAND_EXCLUSION_PATTERN, 'hand-related meshes for foot/ankle'),
+        (re.compile('hand|wrist'), _FOOT_EXCLUSION_PATTERN, 'foot-related meshes for hand/wrist'),
+    )
+    
+    # Left/right indicators in mesh names, each side compiled into one case-insensitive alternation
+    _LEFT_SIDE_PATTERN = re.compile(r'left|l_|_l|\.l|l\.|l | l|lft|lt', re.IGNORECASE)
+    _RIGHT_SIDE_PATTERN = re.compile(r'right|r_|_r|\.r|r\.|r | r|rgt|rt', re.IGNORECASE)
+    # Both sides in one scan; lastgroup names the side of the leftmost indicator
+    _SIDE_PATTERN = re.compile(
+        f'(?P<left>{_LEFT_SIDE_PATTERN.pattern})|(?P<right>{_RIGHT_SIDE_PATTERN.pattern})',
+        re.IGNORECASE
+    )
+    # Side affix of a lower-cased body part key such as 'knee_left' or 'right_hand'
+    _BODY_PART_SIDE_AFFIX = re.compile(r'_(left|right)|(left|right)_')
+    
+    # Lower-cased BODY_PART_MESH_MAPPING patterns, computed once at import
+    _BODY_PART_MESH_MAPPING_LOWER = {
+        body_part: tuple(map(str.lower, patterns))
+        for body_part, patterns in BODY_PART_MESH_MAPPING.items()
+    }
+    
     def __init__(self, fbx_path):
         print(f"Initializing InjuryVisualizer with FBX path: {fbx_path}")
         self.fbx_path = fbx_path
         # Initialize dictionaries before setup_scene
         self.original_materials = {}
         self.original_visibility = {}
-        self.processed_body_parts = set()  # Track processed body parts to avoid duplicates
+        self.processed_body_parts = set()  # (body part, side) pairs already processed, to avoid duplicates
+        self._obj_by_lower_name = {}  # Lower-cased mesh name -> object, filled in setup_scene
+        self._mesh_aabbs = None  # World-space mesh bounding boxes, built on first topmost search
+        self._mesh_index = {}  # Mesh name -> row in the bounding box arrays
+        self._mesh_region_ids = None  # Region id per bounding box row
+        self._region_by_name = {}  # Mesh name -> _extract_region result
+        self._lower_names = {}  # Name -> name.lower(), filled on first use
+        self._material_cache = {}  # (type, severity, alpha, inner, outer) -> injury material
+        self._injury_material_cache = {}  # (status, color, blend method, inner, outer) -> apply_injury_to_mesh material
+        self._matrix_inv_cache = {}  # Mesh name -> (inverted matrix_world, its 3x3 part)
+        self._target_center_cache = {}  # Mesh name -> world-space center used by find_topmost_mesh
+        self._mesh_cache = None  # MeshInfo per scene mesh, built by _build_mesh_cache
+        self._mesh_cache_size = 0  # len(bpy.data.objects) when _mesh_cache was built
+        self._mesh_centers = None  # World centers of _mesh_cache as an (N, 3) array
+        self._mesh_max_dims = None  # Largest dimension of each _mesh_cache entry
+        self._mesh_indices_by_region = {}  # Region -> positions of its meshes in _mesh_cache
+        self._mesh_info_by_name = {}  # Mesh name -> its _mesh_cache entry
+        self._side_masks = {}  # Side -> is_mesh_on_side result per _mesh_cache entry
+        self._exact_mesh_matches = {}  # Body part -> _get_exact_mesh_matches result
         
         # Initialize the AI service for improved mesh detection
         try:
@@ -320,14 +481,18 @@ class InjuryVisualizer:
             
             print(f"Successfully imported {len(bpy.data.objects)} objects")
             
-            # Store original materials and visibility
-            for obj in bpy.data.objects:
-                if obj.type == 'MESH':
-                    if obj.material_slots:
-                        self.original_materials[obj.name] = obj.material_slots[0].material.copy()
-                    else:
-                        self.original_materials[obj.name] = None
-                    self.original_visibility[obj.name] = obj.hide_viewport
+            # Single pass over the scene for everything keyed by mesh
+            meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+            
+            # Store original materials (references only: painting replaces slot
+            # assignments and never edits these materials) and visibility
+            self.original_materials = {obj.name: [slot.material for slot in obj.material_slots] for obj in meshes}
+            self.original_visibility = {obj.name: obj.hide_viewport for obj in meshes}
+            
+            # Case-insensitive name -> mesh index (first object wins on collisions)
+            self._obj_by_lower_name = {}
+            for obj in meshes:
+                self._obj_by_lower_name.setdefault(obj.name.lower(), obj)
             
             # Setup camera
             bpy.ops.object.camera_add()
@@ -337,18 +502,9 @@ class InjuryVisualizer:
             bpy.ops.object.light_add(type='SUN')
             self.light = bpy.context.active_object
             
-            # Setup viewport for better visualization
-            for area in bpy.context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    for space in area.spaces:
-                        if space.type == 'VIEW_3D':
-                            space.shading.type = 'SOLID'
-                            space.shading.use_scene_lights = True
-                            space.shading.use_scene_world = False  # Disable world for better performance
-                            space.shading.light = 'FLAT'  # Use flat lighting for better performance
-                            space.shading.show_specular_highlight = False  # Disable specular for better performance
-            
             # Set up rendering with Workbench renderer instead of EEVEE
+            # (its shading comes from scene.display, so no per-viewport setup is needed;
+            # there is no screen to iterate in background mode anyway)
             bpy.context.scene.render.engine = 'BLENDER_WORKBENCH'
             
             # Configure Workbench settings for better visualization with minimal settings
@@ -362,44 +518,15 @@ class InjuryVisualizer:
             
         except Exception as e:
             print(f"Error setting up scene: {str(e)}")
-            import traceback
             traceback.print_exc()
             raise
     
-    def _get_related_anatomical_terms(self, body_part):
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_related_anatomical_terms(body_part):
         """Get related anatomical terms for a body part using a more comprehensive approach"""
         body_part = body_part.lower()
-        
-        # Define anatomical mappings for common body parts
-        anatomical_mappings = {
-            'biceps': ['bicep', 'biceps', 'brachii', 'arm', 'upper arm'],
-            'triceps': ['tricep', 'triceps', 'brachii', 'arm', 'upper arm'],
-            'deltoid': ['deltoid', 'shoulder', 'delt'],
-            'gastrocnemius': ['gastrocnemius', 'calf', 'leg', 'gastroc', 'soleus'],
-            'quadriceps': ['quad', 'quadricep', 'quadriceps', 'thigh', 'femur', 'leg', 'anterior', 'femoral', 'vastus'],
-            'hamstring': ['hamstring', 'thigh', 'leg', 'posterior', 'femur', 'biceps femoris'],
-            'pectoralis': ['pec', 'chest', 'pectoral', 'pectoralis'],
-            'latissimus': ['lat', 'back', 'latissimus', 'dorsi'],
-            'trapezius': ['trap', 'back', 'trapezius', 'shoulder'],
-            'gluteus': ['glute', 'buttock', 'gluteus', 'maximus'],
-            'abdominals': ['abs', 'abdomen', 'rectus', 'abdominis'],
-            'shoulder': ['shoulder', 'deltoid', 'rotator', 'cuff', 'supraspinatus', 'infraspinatus', 'teres'],
-            'knee': ['knee', 'patella', 'leg', 'joint'],
-            'ankle': ['ankle', 'foot', 'tarsal', 'joint'],
-            'wrist': ['wrist', 'hand', 'carpal', 'joint'],
-            'elbow': ['elbow', 'arm', 'joint', 'ulnar'],
-            'hip': ['hip', 'pelvis', 'joint', 'iliac'],
-            'neck': ['neck', 'cervical', 'spine'],
-            'back': ['back', 'spine', 'vertebra', 'lumbar', 'thoracic'],
-            'chest': ['chest', 'thorax', 'rib', 'pectoral', 'sternum'],
-            'arm': ['arm', 'humerus', 'bicep', 'tricep', 'brachial', 'brachii'],
-            'forearm': ['forearm', 'radius', 'ulna', 'wrist'],
-            'thigh': ['thigh', 'femur', 'quadricep', 'quadriceps', 'quad', 'hamstring', 'femoral'],
-            'leg': ['leg', 'tibia', 'fibula', 'calf', 'shin', 'gastrocnemius'],
-            'foot': ['foot', 'toe', 'metatarsal', 'calcaneus', 'heel', 'plantar', 'tarsal', 'phalanges', 'digit', 'hallux', 'talus', 'navicular', 'cuboid', 'cuneiform', 'interossei'],
-            'upper arm': ['bicep', 'tricep', 'brachii', 'humerus', 'arm', 'upper arm', 'brachialis'],
-            'calf': ['calf', 'gastrocnemius', 'soleus', 'leg', 'lower leg', 'achilles']
-        }
+        anatomical_mappings = InjuryVisualizer.ANATOMICAL_MAPPINGS
         
         # Find related terms from anatomical mappings
         related_terms = []
@@ -409,35 +536,64 @@ class InjuryVisualizer:
             related_terms.extend(anatomical_mappings[body_part])
             print(f"  (INFO: Found related anatomical terms for '{body_part}': {', '.join(anatomical_mappings[body_part])})")
         
-        # Then check for partial matches
-        for key, terms in anatomical_mappings.items():
-            if key not in body_part and (key in body_part or any(term in body_part for term in terms)):
+        # Then check for partial matches: each distinct term is tested once via the reverse index
+        matched_positions = set()
+        for term, positions in InjuryVisualizer._RELATED_TERM_INDEX.items():
+            if term in body_part:
+                matched_positions.update(positions)
+        mapping_items = list(anatomical_mappings.items())
+        for position in sorted(matched_positions):
+            key, terms = mapping_items[position]
+            if key not in body_part:
                 related_terms.extend(terms)
                 print(f"  (INFO: Found related anatomical terms for '{body_part}' via '{key}': {', '.join(terms)})")
         
         # Add the original body part to the related terms
-        if body_part not in related_terms:
-            related_terms.append(body_part)
+        related_terms.append(body_part)
         
-        # Remove duplicates while preserving order
-        unique_terms = []
-        for term in related_terms:
-            if term not in unique_terms:
-                unique_terms.append(term)
-        
-        return unique_terms
+        # Remove duplicates while preserving order; a tuple so the cached value can't be mutated
+        return tuple(dict.fromkeys(related_terms))
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_related_term_patterns(body_part):
+        """Compiled (any related term, related terms longer than 5 characters) patterns for a body part"""
+        related_terms = InjuryVisualizer._get_related_anatomical_terms(body_part)
+        return (
+            _compile_alternation(related_terms),
+            _compile_alternation(tuple(term for term in related_terms if len(term) > 5))
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _resolve_exclusions(body_part):
+        """(exclusion pattern, description) of every rule triggered by a lower-cased body part"""
+        return tuple(
+            (pattern, description)
+            for trigger, pattern, description in InjuryVisualizer._EXCLUSION_RULES
+            if trigger.search(body_part)
+        )
     
     def create_injury_material(self, injury_type, severity, alpha_multiplier=1.0, is_inner=False, is_outer=False):
-        """Create material for injury visualization"""
+        """Create material for injury visualization, reusing one per distinct parameter set"""
+        cache_key = (injury_type, severity, round(alpha_multiplier, 3), is_inner, is_outer)
+        cached_material = self._material_cache.get(cache_key)
+        if cached_material is not None:
+            return cached_material
+        
         # Use descriptive material name
         material_name_suffix = 'inner' if is_inner else ('outer' if is_outer else 'default')
-        material_name = f"Injury_{injury_type}_{severity}_{material_name_suffix}_{time.time()}"
+        material_name = f"Injury_{injury_type}_{severity}_{material_name_suffix}_{cache_key[2]}"
+        
+        config = self.PAINTING_CONFIG
         
         # Get injury color based on type
         injury_color = self.INJURY_COLORS.get(injury_type, (1.0, 0.0, 0.0, 1.0))  # Default to red if not found
         
-        # Create new material
-        material = bpy.data.materials.new(name=material_name)
+        # Recycle a material of the same name (left by an earlier run) before allocating a new one
+        material = bpy.data.materials.get(material_name)
+        if material is None:
+            material = bpy.data.materials.new(name=material_name)
         material.use_nodes = False  # Use simpler material model for better performance
         
         # Set alpha transparency based on severity and mesh type
@@ -446,7 +602,7 @@ class InjuryVisualizer:
         # Set different alpha for inner vs outer meshes
         if is_inner:
             # Inner meshes should be fully visible with injury color
-            alpha = severity_alpha * self.PAINTING_CONFIG.get('inner_mesh_alpha_multiplier', 1.0) * alpha_multiplier
+            alpha = severity_alpha * config.get('inner_mesh_alpha_multiplier', 1.0) * alpha_multiplier
             print(f"Creating inner mesh material with alpha {alpha}")
         elif is_outer:
             # Outer meshes should be transparent
@@ -459,24 +615,14 @@ class InjuryVisualizer:
         # Set material properties with the right alpha
         material.diffuse_color = (injury_color[0], injury_color[1], injury_color[2], alpha)
         
-        # Set emission for better visibility
-        emission_strength = self.PAINTING_CONFIG.get('emission_strength', 1.0)
-        if is_inner:
-            emission_mix = self.PAINTING_CONFIG.get('inner_emission_mix', 0.5)
-            emission_strength = self.PAINTING_CONFIG.get('emission_strength', 1.0)
-        elif is_outer:
-            emission_mix = self.PAINTING_CONFIG.get('outer_emission_mix', 0.2)
-            emission_strength = self.PAINTING_CONFIG.get('outer_emission_strength', 1.0)
-        else:
-            emission_mix = 0.5
-        
-        material.roughness = self.PAINTING_CONFIG.get('roughness', 0.9)
+        material.roughness = config.get('roughness', 0.9)
         
         # Set transparency options
         material.blend_method = 'HASHED'  # Change from BLEND to HASHED for better transparency sorting
         material.shadow_method = 'NONE'
-        material.use_backface_culling = self.PAINTING_CONFIG.get('use_backface_culling', False)
+        material.use_backface_culling = config.get('use_backface_culling', False)
         
+        self._material_cache[cache_key] = material
         return material
     
     def find_topmost_mesh(self, target_mesh_name):
@@ -490,58 +636,233 @@ class InjuryVisualizer:
         if not self.PAINTING_CONFIG.get('use_topmost_mesh', False):
             return target_obj
 
-        # Get target mesh's center and create a ray from above
-        target_center = target_obj.matrix_world @ target_obj.location
+        # Get target mesh's geometric center (its bound box centroid in world space;
+        # obj.location is only the origin in parent space) and create a ray from above
+        target_center = self._target_center_cache.get(target_obj.name)
+        if target_center is None:
+            center_local = sum((mathutils.Vector(corner) for corner in target_obj.bound_box), mathutils.Vector()) / 8.0
+            target_center = target_obj.matrix_world @ center_local
+            self._target_center_cache[target_obj.name] = target_center
         ray_origin = target_center.copy()
         ray_origin.z += 10.0  # Start ray from above
         ray_direction = mathutils.Vector((0, 0, -1))  # Ray pointing down
 
-        # Find all intersecting meshes
-        intersecting_meshes = []
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH':
-                # Skip meshes that are clearly in different body regions
-                if self._is_different_body_region(target_mesh_name, obj.name):
-                    continue
-                    
-                # Convert ray to object space
-                try:
-                    matrix_inv = obj.matrix_world.inverted()
-                    ray_origin_obj = matrix_inv @ ray_origin
-                    ray_direction_obj = matrix_inv.to_3x3() @ ray_direction
+        max_distance = self.PAINTING_CONFIG.get('max_topmost_distance', 3.0)
+        
+        # Prefilter with world-space AABBs: a vertical ray can only hit meshes whose
+        # XY box contains the ray, and only within max_distance if the box does
+        meshes, aabb_min, aabb_max = self._get_mesh_aabbs()
+        center = np.array(target_center[:], dtype=np.float64)
+        box_distance = np.linalg.norm(np.clip(center, aabb_min, aabb_max) - center, axis=1)
+        mask = (
+            (aabb_min[:, 0] <= ray_origin.x) & (ray_origin.x <= aabb_max[:, 0]) &
+            (aabb_min[:, 1] <= ray_origin.y) & (ray_origin.y <= aabb_max[:, 1]) &
+            (aabb_min[:, 2] <= ray_origin.z) & (box_distance < max_distance)
+        )
+        
+        # Skip meshes that are clearly in different body regions (unknown regions never differ)
+        target_region = self._extract_region(target_mesh_name)
+        if target_region is not None:
+            target_region_id = self._REGION_IDS[target_region]
+            mask &= (self._mesh_region_ids == target_region_id) | (self._mesh_region_ids < 0)
+        candidates = np.flatnonzero(mask)
 
-                    # Check for intersection
-                    success, location, normal, face_index = obj.ray_cast(ray_origin_obj, ray_direction_obj)
-                    if success:
-                        # Store mesh and its world space intersection point
-                        world_location = obj.matrix_world @ location
-                        distance = (world_location - target_center).length
-                        
-                        # Only consider meshes that are close to the target
-                        max_distance = self.PAINTING_CONFIG.get('max_topmost_distance', 3.0)
-                        if distance < max_distance:  # Limit to reasonable distance
-                            intersecting_meshes.append((obj, distance, world_location.z))
-                except Exception as e:
-                    print(f"  (WARNING: Error ray-casting on mesh '{obj.name}': {str(e)})")
-                    continue
+        # The target wins whenever its own ray hits within range, so test it first
+        target_index = self._mesh_index.get(target_obj.name)
+        if target_index is not None and target_index in candidates:
+            if self._cast_vertical_ray(target_obj, ray_origin, ray_direction, target_center, max_distance):
+                return target_obj
+
+        # Visit the rest by box top, highest first, and stop once no remaining box
+        # can reach the best hit found so far
+        candidates = candidates[np.argsort(-aabb_max[candidates, 2], kind='stable')]
+        intersecting_meshes = []
+        best_z = float('-inf')
+        for index in candidates:
+            if aabb_max[index, 2] < best_z:
+                break
+            obj = meshes[index]
+            if index == target_index:
+                continue
+            
+            hit = self._cast_vertical_ray(obj, ray_origin, ray_direction, target_center, max_distance)
+            if hit:
+                distance, hit_z = hit
+                intersecting_meshes.append((obj, distance, hit_z, index))
+                best_z = max(best_z, hit_z)
 
         if not intersecting_meshes:
             print(f"  (INFO: No intersecting meshes found, using target mesh '{target_mesh_name}' directly)")
             return target_obj  # Fall back to target mesh if no intersections
 
         # Sort by Z coordinate (highest first) and distance to target
-        intersecting_meshes.sort(key=lambda x: (-x[2], x[1]))
-        
-        # Prefer the target mesh if it's in the list of intersecting meshes
-        for i, (obj, _, _) in enumerate(intersecting_meshes):
-            if obj.name == target_mesh_name:
-                return obj
+        intersecting_meshes.sort(key=lambda x: (-x[2], x[1], x[3]))
                 
         # Return the topmost mesh (first in sorted list)
         topmost_obj = intersecting_meshes[0][0]
         print(f"  (INFO: Using topmost mesh '{topmost_obj.name}' instead of '{target_mesh_name}')")
         return topmost_obj
     
+    def _cast_vertical_ray(self, obj, ray_origin, ray_direction, target_center, max_distance):
+        """Ray cast against one mesh; return (distance, world z) of a hit within max_distance, else None"""
+        # Convert ray to object space (inverse transforms are cached: objects don't move after import)
+        try:
+            cached_inv = self._matrix_inv_cache.get(obj.name)
+            if cached_inv is None:
+                matrix_inv = obj.matrix_world.inverted()
+                cached_inv = (matrix_inv, matrix_inv.to_3x3())
+                self._matrix_inv_cache[obj.name] = cached_inv
+            matrix_inv, matrix_inv_3x3 = cached_inv
+            ray_origin_obj = matrix_inv @ ray_origin
+            ray_direction_obj = matrix_inv_3x3 @ ray_direction
+
+            # Check for intersection
+            success, location, normal, face_index = obj.ray_cast(ray_origin_obj, ray_direction_obj)
+            if success:
+                # World space intersection point
+                world_location = obj.matrix_world @ location
+                distance = (world_location - target_center).length
+                
+                # Only consider meshes that are close to the target
+                if distance < max_distance:  # Limit to reasonable distance
+                    return distance, world_location.z
+        except Exception as e:
+            print(f"  (WARNING: Error ray-casting on mesh '{obj.name}': {str(e)})")
+        return None
+    
+    def _get_mesh_aabbs(self):
+        """Return (meshes, mins, maxs) world-space bounding boxes, computed once per scene"""
+        # Rows follow the shared mesh snapshot instead of re-walking bpy.data.objects;
+        # fetching it first lets a rebuild clear boxes taken from a stale snapshot
+        mesh_cache = self._get_mesh_cache()
+        if self._mesh_aabbs is None:
+            meshes = [mesh.obj for mesh in mesh_cache]
+            aabb_min = np.empty((len(meshes), 3), dtype=np.float64)
+            aabb_max = np.empty((len(meshes), 3), dtype=np.float64)
+            for i, obj in enumerate(meshes):
+                matrix = np.array(obj.matrix_world, dtype=np.float64)
+                corners = np.array(obj.bound_box, dtype=np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+                aabb_min[i] = corners.min(axis=0)
+                aabb_max[i] = corners.max(axis=0)
+            # Pad slightly so float error never rejects a mesh the exact ray cast would hit
+            self._mesh_aabbs = (meshes, aabb_min - 1e-4, aabb_max + 1e-4)
+            self._mesh_index = {obj.name: i for i, obj in enumerate(meshes)}
+            # Region of each mesh as a small int (-1 when unknown) for vectorised filtering
+            self._mesh_region_ids = np.array(
+                [self._REGION_IDS.get(mesh.region, -1) for mesh in mesh_cache],
+                dtype=np.int8
+            )
+        return self._mesh_aabbs
+    
+    def _lower_name(self, name):
+        """Return name.lower(), computing it once per distinct name"""
+        lower = self._lower_names.get(name)
+        if lower is None:
+            lower = self._lower_names[name] = name.lower()
+        return lower
+    
+    def _build_mesh_cache(self):
+        """Snapshot name, region, center and size of every mesh for the traversal functions"""
+        self._mesh_cache = []
+        for obj in bpy.data.objects:
+            if obj.type != 'MESH':
+                continue
+            # One RNA fetch of the dimensions serves both size measures
+            dimensions = obj.dimensions
+            self._mesh_cache.append(MeshInfo(
+                obj,
+                obj.name,
+                self._lower_name(obj.name),
+                self._extract_region(obj.name),
+                obj.matrix_world @ obj.location,
+                max(dimensions.x, dimensions.y, dimensions.z),
+                _charset_bitmap(self._lower_name(obj.name)),
+                obj.matrix_world.translation.x,
+                dimensions.x * dimensions.y * dimensions.z
+            ))
+        # The same centers and sizes as arrays, for vectorised proximity tests
+        self._mesh_centers = np.array([tuple(mesh.center) for mesh in self._mesh_cache], dtype=np.float64).reshape(-1, 3)
+        self._mesh_max_dims = np.array([mesh.max_dim for mesh in self._mesh_cache], dtype=np.float64)
+        self._mesh_info_by_name = {mesh.name: mesh for mesh in self._mesh_cache}
+        # Region -> positions in _mesh_cache, so region filters only visit that region's meshes
+        self._mesh_indices_by_region = {}
+        for i, mesh in enumerate(self._mesh_cache):
+            self._mesh_indices_by_region.setdefault(mesh.region, []).append(i)
+        # Everything derived from the previous snapshot is stale now
+        self._side_masks = {}
+        self._exact_mesh_matches = {}
+        self._mesh_aabbs = None
+        self._mesh_index = {}
+        self._mesh_region_ids = None
+        self._matrix_inv_cache = {}
+        self._target_center_cache = {}
+        self._mesh_cache_size = len(bpy.data.objects)
+        return self._mesh_cache
+    
+    def _get_mesh_cache(self):
+        """Return the mesh snapshot, rebuilding it if objects were added or removed"""
+        if self._mesh_cache is None or self._mesh_cache_size != len(bpy.data.objects):
+            return self._build_mesh_cache()
+        return self._mesh_cache
+    
+    def _get_side_mask(self, side):
+        """Return is_mesh_on_side(name, side) for every _mesh_cache entry, computed once per side"""
+        mesh_cache = self._get_mesh_cache()
+        side_mask = self._side_masks.get(side)
+        if side_mask is None:
+            side_mask = self._side_masks[side] = np.array(
+                [self.is_mesh_on_side(mesh.name, side) for mesh in mesh_cache], dtype=bool
+            )
+        return side_mask
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _exact_mesh_patterns(body_part):
+        """Exact mesh name patterns for a normalized body part, as a tuple"""
+        mapping = InjuryVisualizer.EXACT_INJURY_MESH_MAPPING
+        
+        # First check for exact matches in our mapping
+        if body_part in mapping:
+            return tuple(mapping[body_part])
+        
+        # If no exact match, check for partial matches
+        for key, patterns in mapping.items():
+            if key in body_part or body_part in key:
+                return tuple(patterns)
+        
+        # If still no matches, split the body part into words and use words with 4+ characters
+        words = tuple(word for word in body_part.split() if len(word) >= 4)
+        
+        # If still no patterns, use the whole body part name
+        return words or (body_part,)
+    
+    def _get_exact_mesh_matches(self, body_part):
+        """(position in _mesh_cache, relevance score) of every mesh matching body_part's exact patterns, in scene order"""
+        mesh_cache = self._get_mesh_cache()
+        exact_matches = self._exact_mesh_matches.get(body_part)
+        if exact_matches is None:
+            patterns_lower = tuple(pattern.lower() for pattern in self._exact_mesh_patterns(body_part))
+            patterns_re = _compile_alternation(patterns_lower)
+            exact_matches = []
+            for position, mesh in enumerate(mesh_cache):
+                match = patterns_re.search(mesh.name_lower)
+                if not match:
+                    continue
+                logger.debug("Found exact match '%s' for pattern '%s'", mesh.name, match.group())
+                
+                # Exact body part name in mesh name gets highest score
+                score = 10 if body_part in mesh.name_lower else 0
+                
+                # Each pattern match adds to the score
+                score += 5 * sum(1 for pattern_lower in patterns_lower if pattern_lower in mesh.name_lower)
+                
+                # Shorter names are likely more specific
+                score -= len(mesh.name_lower) * 0.1
+                
+                exact_matches.append((position, score))
+            self._exact_mesh_matches[body_part] = exact_matches
+        return exact_matches
+    
     def _is_different_body_region(self, mesh1, mesh2):
         """Check if two meshes are in different body regions"""
         # Extract region from mesh names
@@ -559,11 +880,7 @@ class InjuryVisualizer:
         """Paint a mesh with injury visualization material"""
         if isinstance(mesh_name, str):
             # Ensure we have the actual object
-            mesh_obj = None
-            for obj in bpy.data.objects:
-                if obj.name.lower() == mesh_name.lower():
-                    mesh_obj = obj
-                    break
+            mesh_obj = self._obj_by_lower_name.get(self._lower_name(mesh_name))
             
             if not mesh_obj:
                 print(f"  (WARNING: Could not find mesh with name '{mesh_name}')")
@@ -573,9 +890,11 @@ class InjuryVisualizer:
             mesh_obj = mesh_name
             mesh_name = mesh_obj.name
         
-        # Store original material for later restoration
-        self.original_materials[mesh_name] = [slot.material for slot in mesh_obj.material_slots]
-        self.original_visibility[mesh_name] = mesh_obj.hide_viewport
+        # Store original material for later restoration, unless already backed up
+        # (by now the slots may hold the x-ray material rather than the original)
+        if mesh_name not in self.original_materials:
+            self.original_materials[mesh_name] = [slot.material for slot in mesh_obj.material_slots]
+            self.original_visibility[mesh_name] = mesh_obj.hide_viewport
         
         # Make sure the object is visible
         mesh_obj.hide_viewport = False
@@ -583,38 +902,35 @@ class InjuryVisualizer:
         
         # Check if this is a specific outer mesh that should be forced transparent
         # Normalize mesh name by removing l/r suffix for matching
-        normalized_mesh_name = mesh_name.lower()
+        normalized_mesh_name = self._lower_name(mesh_name)
         if normalized_mesh_name.endswith('l') or normalized_mesh_name.endswith('r'):
             normalized_mesh_name = normalized_mesh_name[:-1]
         
         # Special handling for foot vs hand confusion
         body_part = injury.get('bodyPart', '').lower()
         
-        # If dealing with foot injuries, skip hand-related meshes
-        if 'foot' in body_part or 'ankle' in body_part:
-            if any(term in normalized_mesh_name for term in ['hand', 'palmar', 'pollicis', 'carpal', 'carpus', 'metacarpal']):
-                print(f"  (INFO: Skipping hand-related mesh '{mesh_name}' for foot/ankle injury)")
-                return False
-                
-        # If dealing with hand injuries, skip foot-related meshes
-        if 'hand' in body_part or 'wrist' in body_part:
-            if any(term in normalized_mesh_name for term in ['foot', 'plantar', 'hallucis', 'tarsal', 'tarsus', 'metatarsal']):
-                print(f"  (INFO: Skipping foot-related mesh '{mesh_name}' for hand/wrist injury)")
+        # Skip hand-related meshes for foot injuries and foot-related meshes for hand injuries
+        for exclusion_pattern, exclusion_description in self._resolve_exclusions(body_part):
+            if exclusion_pattern.search(normalized_mesh_name):
+                print(f"  (INFO: Skipping mesh '{mesh_name}': excluding {exclusion_description} injury)")
                 return False
         
-        # Check against outer meshes list
-        is_specific_outer = False
-        for outer_mesh in self.OUTER_MESHES:
-            outer_lower = outer_mesh.lower()
-            if outer_lower in normalized_mesh_name or normalized_mesh_name in outer_lower:
-                is_specific_outer = True
-                print(f"  (INFO: Detected outer mesh '{mesh_name}' matching entry '{outer_mesh}')")
-                break
+        # Check against outer meshes list: an entry inside the name, or the name inside an entry
+        if normalized_mesh_name in self._OUTER_MESH_SET:
+            # Exact entry: no need to scan
+            outer_match = None
+            is_specific_outer = True
+        else:
+            outer_match = self._OUTER_MESH_PATTERN.search(normalized_mesh_name)
+            is_specific_outer = outer_match is not None or normalized_mesh_name in self._OUTER_MESH_BLOB
+        if is_specific_outer:
+            matched_entry = outer_match.group() if outer_match else normalized_mesh_name
+            print(f"  (INFO: Detected outer mesh '{mesh_name}' matching entry '{matched_entry}')")
         
         # Special handling for known muscle groups
-        is_biceps = 'bicep' in normalized_mesh_name.lower() or 'brachii' in normalized_mesh_name.lower()
-        is_quadriceps = 'quad' in normalized_mesh_name.lower() or 'femoris' in normalized_mesh_name.lower()
-        is_deltoid = 'deltoid' in normalized_mesh_name.lower() or 'shoulder' in normalized_mesh_name.lower()
+        is_biceps = 'bicep' in normalized_mesh_name or 'brachii' in normalized_mesh_name
+        is_quadriceps = 'quad' in normalized_mesh_name or 'femoris' in normalized_mesh_name
+        is_deltoid = 'deltoid' in normalized_mesh_name or 'shoulder' in normalized_mesh_name
         
         # Determine if mesh is on inner or outer list
         if is_inner and is_specific_outer:
@@ -650,106 +966,90 @@ class InjuryVisualizer:
             is_outer=is_outer
         )
         
-        # Apply material to all slots of the mesh
-        if mesh_obj.data.materials:
-            # Replace all material slots
-            for i in range(len(mesh_obj.data.materials)):
-                mesh_obj.data.materials[i] = material
+        # Apply material to all slots of the mesh, writing only slots that differ
+        materials = mesh_obj.data.materials
+        if materials:
+            for i, slot_material in enumerate(materials):
+                if slot_material != material:
+                    materials[i] = material
         else:
             # No existing materials, add a new one
-            mesh_obj.data.materials.append(material)
+            materials.append(material)
         
         return True
 
     def _extract_region(self, mesh_name):
         """Extract body region from mesh name"""
-        # Common body regions to check for
-        regions = {
-            'head': ['head', 'skull', 'cranium', 'face', 'jaw', 'mandible'],
-            'neck': ['neck', 'cervical'],
-            'shoulder': ['shoulder', 'clavicle', 'scapula'],
-            'arm': ['arm', 'humerus', 'bicep', 'tricep', 'brachii'],
-            'elbow': ['elbow'],
-            'forearm': ['forearm', 'radius', 'ulna'],
-            'wrist': ['wrist', 'carpal'],
-            'hand': ['hand', 'finger', 'thumb', 'palm', 'metacarpal', 'phalanx'],
-            'chest': ['chest', 'thorax', 'thoracic', 'pectoral', 'sternum', 'rib'],
-            'abdomen': ['abdomen', 'abdominal', 'stomach', 'belly'],
-            'back': ['back', 'spine', 'spinal', 'vertebra', 'vertebrae', 'lumbar'],
-            'hip': ['hip', 'pelvis', 'pelvic', 'ilium', 'iliac'],
-            'thigh': ['thigh', 'femur', 'quadricep', 'quadriceps', 'quad', 'hamstring', 'femoral'],
-            'knee': ['knee', 'patella', 'patellar'],
-            'leg': ['leg', 'shin', 'calf', 'tibia', 'fibula', 'gastrocnemius'],
-            'ankle': ['ankle', 'tarsal'],
-            'foot': ['foot', 'feet', 'toe', 'metatarsal', 'calcaneus', 'heel']
-        }
+        if mesh_name in self._region_by_name:
+            return self._region_by_name[mesh_name]
         
         # Convert mesh name to lowercase for case-insensitive matching
         mesh_lower = mesh_name.lower()
         
-        # Check for each region
-        for region, keywords in regions.items():
-            for keyword in keywords:
-                if keyword in mesh_lower:
-                    return region
+        # Check for each region, in priority order; None if no region found
+        found_region = None
+        for region, pattern in self._MESH_REGION_PATTERNS:
+            if pattern.search(mesh_lower):
+                found_region = region
+                break
         
-        # If no region found, return None
-        return None
+        self._region_by_name[mesh_name] = found_region
+        return found_region
     
     def is_mesh_on_side(self, mesh_name, side):
         """Check if a mesh is on the specified side (left or right)"""
-        if not side or side.lower() not in ['left', 'right']:
+        side_lower = side.lower() if side else None
+        if side_lower not in ('left', 'right'):
             return True  # If no side specified, consider it a match
-            
-        mesh_lower = mesh_name.lower()
-        side_lower = side.lower()
-        
-        # Check for explicit side indicators in the mesh name
-        left_indicators = ['left', 'l_', '_l', '.l', 'l.', 'l ', ' l', 'lft', 'lt']
-        right_indicators = ['right', 'r_', '_r', '.r', 'r.', 'r ', ' r', 'rgt', 'rt']
         
         # Special check for 'l' or 'r' at the end of the mesh name
-        if mesh_lower.endswith('l'):
-            print(f"  (INFO: Mesh '{mesh_name}' identified as LEFT side due to 'l' suffix")
+        last_char = mesh_name[-1:]
+        if last_char in ('l', 'L'):
+            logger.debug("Mesh '%s' identified as LEFT side due to 'l' suffix", mesh_name)
             return side_lower == 'left'
             
-        if mesh_lower.endswith('r'):
-            print(f"  (INFO: Mesh '{mesh_name}' identified as RIGHT side due to 'r' suffix")
+        if last_char in ('r', 'R'):
+            logger.debug("Mesh '%s' identified as RIGHT side due to 'r' suffix", mesh_name)
             return side_lower == 'right'
         
-        # Check for opposite side indicators
-        opposite_indicators = left_indicators if side_lower == 'right' else right_indicators
-        for indicator in opposite_indicators:
-            if indicator in mesh_lower:
-                print(f"  (INFO: Mesh '{mesh_name}' rejected due to opposite side indicator '{indicator}'")
+        # Check for explicit side indicators in the mesh name: an indicator for the
+        # opposite side anywhere rejects the mesh, otherwise a matching one accepts it
+        match = self._SIDE_PATTERN.search(mesh_name)
+        if match:
+            if match.lastgroup != side_lower:
+                logger.debug("Mesh '%s' rejected due to opposite side indicator '%s'", mesh_name, match.group().lower())
                 return False  # Mesh has indicator for the opposite side
-        
-        # Check for matching side indicators
-        matching_indicators = right_indicators if side_lower == 'right' else left_indicators
-        for indicator in matching_indicators:
-            if indicator in mesh_lower:
-                print(f"  (INFO: Mesh '{mesh_name}' matched due to side indicator '{indicator}'")
-                return True  # Mesh has indicator for the matching side
+            
+            # Nothing matched before this indicator, so only look for the opposite side from here on
+            opposite_pattern = self._LEFT_SIDE_PATTERN if side_lower == 'right' else self._RIGHT_SIDE_PATTERN
+            opposite_match = opposite_pattern.search(mesh_name, match.start())
+            if opposite_match:
+                logger.debug("Mesh '%s' rejected due to opposite side indicator '%s'", mesh_name, opposite_match.group().lower())
+                return False
+            
+            logger.debug("Mesh '%s' matched due to side indicator '%s'", mesh_name, match.group().lower())
+            return True  # Mesh has indicator for the matching side
                 
-        # If no explicit indicators, check mesh position
-        obj = bpy.data.objects.get(mesh_name)
+        # If no explicit indicators, check mesh position (from the mesh snapshot when available)
+        mesh = self._mesh_info_by_name.get(mesh_name)
+        obj = mesh.obj if mesh else bpy.data.objects.get(mesh_name)
         if obj:
-            # Get object's world position
-            position = obj.matrix_world.translation
+            # Get object's world X position
+            position_x = mesh.x if mesh else obj.matrix_world.translation.x
             
             # Check if object is on the left or right side based on X coordinate
             # In Blender, negative X is typically left, positive X is right
-            if side_lower == 'left' and position.x < 0:
-                print(f"  (INFO: Mesh '{mesh_name}' identified as LEFT side due to position (X={position.x})")
+            if side_lower == 'left' and position_x < 0:
+                logger.debug("Mesh '%s' identified as LEFT side due to position (X=%s)", mesh_name, position_x)
                 return True
-            elif side_lower == 'right' and position.x > 0:
-                print(f"  (INFO: Mesh '{mesh_name}' identified as RIGHT side due to position (X={position.x})")
+            elif side_lower == 'right' and position_x > 0:
+                logger.debug("Mesh '%s' identified as RIGHT side due to position (X=%s)", mesh_name, position_x)
                 return True
             else:
-                print(f"  (INFO: Mesh '{mesh_name}' position (X={position.x}) does not match requested side '{side_lower}')")
+                logger.debug("Mesh '%s' position (X=%s) does not match requested side '%s'", mesh_name, position_x, side_lower)
                 
         # If we couldn't determine the side, return True to avoid filtering out potentially relevant meshes
-        print(f"  (INFO: Could not determine side for mesh '{mesh_name}', including it anyway)")
+        logger.debug("Could not determine side for mesh '%s', including it anyway", mesh_name)
         return True
     
     def find_inner_meshes(self, muscle_name, injury):
@@ -760,47 +1060,46 @@ class InjuryVisualizer:
         print(f"Finding inner meshes for {body_part} ({side} side)...")
         
         # Define exclusion terms based on body part
-        exclusion_terms = []
-        if 'foot' in body_part or 'ankle' in body_part:
-            exclusion_terms = ['hand', 'palmar', 'pollicis', 'carpal', 'carpus', 'metacarpal']
-            print(f"  (INFO: Will exclude hand-related meshes for foot/ankle injury)")
-        elif 'hand' in body_part or 'wrist' in body_part:
-            exclusion_terms = ['foot', 'plantar', 'hallucis', 'tarsal', 'tarsus', 'metatarsal']
-            print(f"  (INFO: Will exclude foot-related meshes for hand/wrist injury)")
-        
-        # Get related anatomical terms for the body part
-        related_terms = self._get_related_anatomical_terms(body_part)
+        exclusion_pattern = None
+        exclusions = self._resolve_exclusions(body_part)
+        if exclusions:
+            exclusion_pattern, exclusion_description = exclusions[0]
+            print(f"  (INFO: Will exclude {exclusion_description} injury)")
+        
+        # Get related anatomical terms for the body part, compiled once per body part: any related
+        # term, only the longer (more specific) ones, and the body part's own words
+        related_pattern, specific_pattern = self._get_related_term_patterns(body_part)
+        body_part_words = body_part.split()
+        word_pattern = _compile_alternation(tuple(word for word in body_part_words if len(word) > 3))
         
         # Find meshes that match any of the related terms
+        mesh_cache = self._get_mesh_cache()
+        on_side = self._get_side_mask(side)
         inner_meshes = []
-        for obj in bpy.data.objects:
-            if obj.type != 'MESH':
-                continue
+        for i, mesh in enumerate(mesh_cache):
+            obj = mesh.obj
                 
             # Skip meshes that match exclusion terms
-            obj_name_lower = obj.name.lower()
-            if exclusion_terms and any(term in obj_name_lower for term in exclusion_terms):
-                print(f"  (INFO: Excluding mesh '{obj.name}' due to exclusion terms)")
+            obj_name_lower = mesh.name_lower
+            if exclusion_pattern and exclusion_pattern.search(obj_name_lower):
+                logger.debug("Excluding mesh '%s' due to exclusion terms", obj.name)
                 continue
                 
             # Check if mesh name contains any related term
-            for term in related_terms:
-                if term.lower() in obj_name_lower:
-                    # Check if mesh is on the correct side
-                    if self.is_mesh_on_side(obj.name, side):
-                        # Additional filtering: Check if the mesh name directly contains the body part name
-                        # This makes the matching more strict
-                        body_part_words = body_part.split()
-                        if any(word in obj_name_lower for word in body_part_words if len(word) > 3):
-                            print(f"  (INFO: Found mesh '{obj.name}' with direct match to body part '{body_part}')")
+            if related_pattern.search(obj_name_lower):
+                # Check if mesh is on the correct side
+                if on_side[i]:
+                    # Additional filtering: Check if the mesh name directly contains the body part name
+                    # This makes the matching more strict
+                    if word_pattern and word_pattern.search(obj_name_lower):
+                        logger.debug("Found mesh '%s' with direct match to body part '%s'", obj.name, body_part)
+                        inner_meshes.append(obj)
+                    else:
+                        # If not a direct match, only include if it's a very specific related term
+                        match = specific_pattern.search(obj_name_lower) if specific_pattern else None
+                        if match:  # Only use longer, more specific terms
+                            logger.debug("Found mesh '%s' with related term '%s'", obj.name, match.group())
                             inner_meshes.append(obj)
-                            break
-                        else:
-                            # If not a direct match, only include if it's a very specific related term
-                            if len(term) > 5:  # Only use longer, more specific terms
-                                print(f"  (INFO: Found mesh '{obj.name}' with related term '{term}')")
-                                inner_meshes.append(obj)
-                                break
         
         print(f"Found {len(inner_meshes)} inner meshes for {body_part}")
         
@@ -809,28 +1108,24 @@ class InjuryVisualizer:
             print(f"  (WARNING: No inner meshes found for '{body_part}'. Trying alternative search...)")
             
             # Try to find any mesh that might be related to the body part
-            # Split the body part into words and search for each word
-            body_part_words = body_part.split()
-            for obj in bpy.data.objects:
-                if obj.type != 'MESH':
-                    continue
-                
-                obj_name_lower = obj.name.lower()
+            # by searching for each word of the body part
+            strict_side = self.PAINTING_CONFIG.get('strict_side_matching', True) and side
+            for i, mesh in enumerate(mesh_cache):
+                obj = mesh.obj
+                obj_name_lower = mesh.name_lower
                 
                 # Skip meshes that match exclusion terms
-                if exclusion_terms and any(term in obj_name_lower for term in exclusion_terms):
+                if exclusion_pattern and exclusion_pattern.search(obj_name_lower):
                     continue
                     
-                # Check if mesh name contains any word from the body part
-                for word in body_part_words:
-                    if len(word) > 3 and word in obj_name_lower:  # Only use words with more than 3 characters
-                        # Check side constraints if applicable
-                        if self.PAINTING_CONFIG.get('strict_side_matching', True) and side:
-                            if not self.is_mesh_on_side(obj.name, side):
-                                continue
-                        inner_meshes.append(obj)  # Store the object directly
-                        print(f"  (INFO: Found mesh '{obj.name}' with partial match to '{word}')")
-                        break
+                # Check if mesh name contains any word (of more than 3 characters) from the body part
+                match = word_pattern.search(obj_name_lower) if word_pattern else None
+                if match:
+                    # Check side constraints if applicable
+                    if strict_side and not on_side[i]:
+                        continue
+                    inner_meshes.append(obj)  # Store the object directly
+                    logger.debug("Found mesh '%s' with partial match to '%s'", obj.name, match.group())
                 
             # If still no meshes found, use a broader search based on body region
             if not inner_meshes:
@@ -840,34 +1135,31 @@ class InjuryVisualizer:
                 body_region = self._determine_body_region(body_part)
                 print(f"  (INFO: Determined body region '{body_region}' for '{body_part}')")
                 
-                # Find meshes in the same body region
-                for obj in bpy.data.objects:
-                    if obj.type != 'MESH':
-                        continue
-                        
-                    obj_region = self._extract_region(obj.name)
-                    if obj_region == body_region:
-                        # Check if mesh is on the correct side
-                        if self.is_mesh_on_side(obj.name, side):
-                            # Additional filtering: Only include meshes that have some similarity to the body part
-                            obj_name_lower = obj.name.lower()
-                            body_part_chars = set(body_part.replace(" ", ""))
-                            obj_name_chars = set(obj_name_lower.replace(" ", ""))
-                            similarity = len(body_part_chars.intersection(obj_name_chars)) / len(body_part_chars)
-                            
-                            if similarity > 0.3:  # At least 30% character overlap
-                                print(f"  (INFO: Found mesh '{obj.name}' in body region '{body_region}' with similarity {similarity:.2f})")
-                                inner_meshes.append(obj)
+                # Characters of the body part, for the overlap ratio below
+                body_part_bits = _charset_bitmap(body_part)
+                body_part_char_count = bin(body_part_bits).count('1')
                 
-                # Limit to a reasonable number of meshes
-                if len(inner_meshes) > self.PAINTING_CONFIG['max_inner_meshes']:
-                    print(f"  (INFO: Limiting from {len(inner_meshes)} to {self.PAINTING_CONFIG['max_inner_meshes']} inner meshes)")
-                    inner_meshes = inner_meshes[:self.PAINTING_CONFIG['max_inner_meshes']]
+                # Find meshes in the same body region, up to the inner mesh limit
+                max_inner = self.PAINTING_CONFIG['max_inner_meshes']
+                for i in self._mesh_indices_by_region.get(body_region, ()):
+                    obj = mesh_cache[i].obj
+                    # Check if mesh is on the correct side
+                    if on_side[i]:
+                        # Additional filtering: Only include meshes that have some similarity to the body part
+                        similarity = bin(body_part_bits & mesh_cache[i].char_bits).count('1') / body_part_char_count
+                        
+                        if similarity > 0.3:  # At least 30% character overlap
+                            logger.debug("Found mesh '%s' in body region '%s' with similarity %.2f", obj.name, body_region, similarity)
+                            inner_meshes.append(obj)
+                            if len(inner_meshes) >= max_inner:
+                                print(f"  (INFO: Reached the limit of {max_inner} inner meshes)")
+                                break
         
         # If still no meshes found, use visible meshes on the correct side as a last resort
         if not inner_meshes:
             print(f"  (WARNING: No specific meshes found for '{body_part}'. Using visible meshes as last resort.)")
-            visible_meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH' and not obj.hide_viewport and self.is_mesh_on_side(obj.name, side)]
+            # (visibility is read live: painting unhides meshes between injuries)
+            visible_meshes = [mesh.obj for mesh, mesh_on_side in zip(mesh_cache, on_side) if mesh_on_side and not mesh.obj.hide_viewport]
             
             # Take a few visible meshes
             max_fallback = min(2, len(visible_meshes))  # Reduced from 3 to 2
@@ -880,29 +1172,9 @@ class InjuryVisualizer:
         """Determine the general body region for a body part"""
         body_part = body_part.lower()
         
-        # Define body regions and their associated terms
-        body_regions = {
-            'head': ['head', 'skull', 'face', 'jaw', 'cranium', 'brain'],
-            'neck': ['neck', 'cervical', 'throat'],
-            'shoulder': ['shoulder', 'deltoid', 'rotator cuff', 'clavicle', 'scapula'],
-            'arm': ['arm', 'bicep', 'tricep', 'humerus', 'brachii', 'upper arm'],
-            'elbow': ['elbow', 'olecranon'],
-            'forearm': ['forearm', 'radius', 'ulna', 'wrist'],
-            'hand': ['hand', 'finger', 'thumb', 'palm', 'wrist'],
-            'chest': ['chest', 'pectoral', 'thorax', 'rib', 'sternum'],
-            'abdomen': ['abdomen', 'stomach', 'abs', 'core'],
-            'back': ['back', 'spine', 'vertebra', 'lumbar', 'thoracic'],
-            'hip': ['hip', 'pelvis', 'iliac', 'sacrum'],
-            'thigh': ['thigh', 'quadricep', 'hamstring', 'femur', 'upper leg'],
-            'knee': ['knee', 'patella', 'meniscus'],
-            'leg': ['leg', 'calf', 'shin', 'tibia', 'fibula', 'gastrocnemius', 'lower leg'],
-            'ankle': ['ankle', 'talus', 'calcaneus'],
-            'foot': ['foot', 'toe', 'heel', 'metatarsal', 'plantar', 'tarsal', 'phalanges', 'digit', 'hallux', 'navicular', 'cuboid', 'cuneiform', 'interossei']
-        }
-        
         # Check each region for matches
-        for region, terms in body_regions.items():
-            if any(term in body_part for term in terms):
+        for region, pattern in self._BODY_REGION_PATTERNS:
+            if pattern.search(body_part):
                 return region
         
         # Default to 'unknown' if no match found
@@ -918,13 +1190,11 @@ class InjuryVisualizer:
         body_part = injury.get('bodyPart', '').lower() if injury.get('bodyPart') else ''
         
         # Define exclusion terms based on body part
-        exclusion_terms = []
-        if 'foot' in body_part or 'ankle' in body_part:
-            exclusion_terms = ['hand', 'palmar', 'pollicis', 'carpal', 'carpus', 'metacarpal']
-            print(f"  (INFO: Will exclude hand-related meshes for foot/ankle injury)")
-        elif 'hand' in body_part or 'wrist' in body_part:
-            exclusion_terms = ['foot', 'plantar', 'hallucis', 'tarsal', 'tarsus', 'metatarsal']
-            print(f"  (INFO: Will exclude foot-related meshes for hand/wrist injury)")
+        exclusion_pattern = None
+        exclusions = self._resolve_exclusions(body_part)
+        if exclusions:
+            exclusion_pattern, exclusion_description = exclusions[0]
+            print(f"  (INFO: Will exclude {exclusion_description} injury)")
         
         # Determine max outer meshes based on injury status - use much smaller values
         if status == 'active':
@@ -952,8 +1222,14 @@ class InjuryVisualizer:
             print(f"  (INFO: Using topmost mesh '{topmost_obj.name}' as reference)")
             target_obj = topmost_obj
             
-        # Get target mesh's center
-        target_center = target_obj.matrix_world @ target_obj.location
+        # Get target mesh's center and size, from the mesh snapshot when it is part of it
+        mesh_cache = self._get_mesh_cache()
+        target_info = self._mesh_info_by_name.get(target_obj.name)
+        if target_info:
+            target_center, target_size = target_info.center, target_info.max_dim
+        else:
+            target_center = target_obj.matrix_world @ target_obj.location
+            target_size = max(target_obj.dimensions.x, target_obj.dimensions.y, target_obj.dimensions.z)
         
         # Determine the body region for filtering
         body_region = self._extract_region(muscle_name)
@@ -962,46 +1238,40 @@ class InjuryVisualizer:
         
         print(f"  (INFO: Using body region '{body_region}' for filtering outer meshes)")
         
+        # Distance of every mesh to the target and whether it is within the proximity
+        # threshold (based on both objects' dimensions), in one vectorised pass
+        distances = np.linalg.norm(self._mesh_centers - np.array(tuple(target_center), dtype=np.float64), axis=1)
+        within_threshold = distances < (self._mesh_max_dims + target_size) * self.PAINTING_CONFIG.get('proximity_multiplier', 1.5)
+        
+        # Cheap filters first: proximity and side (computed once per side for all injuries)
+        # are array lookups, so only meshes passing both reach the name tests and the
+        # live visibility read
+        nearby = within_threshold & self._get_side_mask(side) if side else within_threshold
+        
         # First, check for specific outer meshes from our predefined list
+        outer_pattern = self._OUTER_MESH_PATTERN
         specific_outer_meshes = []
-        for obj in bpy.data.objects:
-            if obj.type != 'MESH' or obj.hide_viewport:
-                continue
-                
+        for i in np.flatnonzero(nearby):
+            mesh = mesh_cache[i]
+            obj = mesh.obj
             if obj.name == target_obj.name:
                 continue
-                    
-            # Check side constraints if applicable
-            if side and not self.is_mesh_on_side(obj.name, side):
-                continue
             
             # Skip meshes that match exclusion terms
-            obj_name_lower = obj.name.lower()
-            if exclusion_terms and any(term in obj_name_lower for term in exclusion_terms):
-                print(f"  (INFO: Excluding mesh '{obj.name}' due to exclusion terms)")
+            obj_name_lower = mesh.name_lower
+            if exclusion_pattern and exclusion_pattern.search(obj_name_lower):
+                logger.debug("Excluding mesh '%s' due to exclusion terms", obj.name)
                 continue
             
-            # Check if this mesh is in our predefined list of outer meshes
-            obj_base_name = obj.name.rstrip('lr')  # Remove potential 'l' or 'r' suffix
-            for outer_mesh in self.OUTER_MESHES:
-                if outer_mesh.lower() in obj.name.lower() or outer_mesh.lower() in obj_base_name.lower():
-                    # Calculate distance for sorting
-                    obj_center = obj.matrix_world @ obj.location
-                    distance = (obj_center - target_center).length
-                    
-                    # Only include if it's close enough to the target
-                    obj_size = max(obj.dimensions.x, obj.dimensions.y, obj.dimensions.z)
-                    target_size = max(target_obj.dimensions.x, target_obj.dimensions.y, target_obj.dimensions.z)
-                    threshold = (obj_size + target_size) * self.PAINTING_CONFIG.get('proximity_multiplier', 1.5)
-                    
-                    if distance < threshold:
-                        specific_outer_meshes.append((obj.name, distance))
-                        print(f"  (INFO: Found specific outer mesh '{obj.name}' matching '{outer_mesh}' at distance {distance:.2f})")
-                    break
+            # Check if this mesh is in our predefined list of outer meshes, in one scan
+            # (the l/r-stripped base name is a prefix of the name, so one test covers both)
+            outer_match = outer_pattern.search(obj_name_lower)
+            if outer_match and not obj.hide_viewport:
+                specific_outer_meshes.append(i)
+                logger.debug("Found specific outer mesh '%s' matching '%s' at distance %.2f", obj.name, outer_match.group(), distances[i])
         
         # Sort specific outer meshes by distance
-        specific_outer_meshes.sort(key=lambda x: x[1])
-        specific_outer_mesh_names = [mesh[0] for mesh in specific_outer_meshes]
+        specific_outer_mesh_names = self._names_by_distance(mesh_cache, specific_outer_meshes, distances)
         
         # If we have enough specific outer meshes, use them
         if len(specific_outer_mesh_names) >= max_outer:
@@ -1011,70 +1281,51 @@ class InjuryVisualizer:
         # If we don't have enough specific outer meshes, find additional ones based on proximity
         print(f"Found {len(specific_outer_mesh_names)} specific outer meshes, looking for additional ones...")
         
-        # Find all visible meshes within a certain distance
+        # Find all visible meshes within a certain distance; words of the body part
+        # (more than 3 characters) are compiled once for the similarity check
+        word_pattern = _compile_alternation(tuple(word for word in body_part.split() if len(word) > 3))
+        body_part_bits = _charset_bitmap(body_part)
+        body_part_char_count = bin(body_part_bits).count('1')
+        specific_indices = set(specific_outer_meshes)
         additional_outer_meshes = []
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH' and not obj.hide_viewport:
-                # Skip if it's the target mesh or already in our specific list
-                if obj.name == target_obj.name or obj.name in specific_outer_mesh_names:
-                    continue
-                    
-                # Check side constraints if applicable
-                if side and not self.is_mesh_on_side(obj.name, side):
-                    continue
-                
-                # Skip meshes that match exclusion terms
-                if exclusion_terms and any(term in obj.name.lower() for term in exclusion_terms):
-                    print(f"  (INFO: Excluding mesh '{obj.name}' due to exclusion terms)")
-                    continue
-                
-                # Check if mesh is in the same body region if we know the region
-                if body_region != 'unknown':
-                    obj_region = self._extract_region(obj.name)
-                    if obj_region != 'unknown' and obj_region != body_region:
-                        continue
-                
-                # Get object's center
-                obj_center = obj.matrix_world @ obj.location
-                
-                # Calculate distance
-                distance = (obj_center - target_center).length
-                
-                # Use a threshold based on the object's dimensions
-                obj_size = max(obj.dimensions.x, obj.dimensions.y, obj.dimensions.z)
-                target_size = max(target_obj.dimensions.x, target_obj.dimensions.y, target_obj.dimensions.z)
-                threshold = (obj_size + target_size) * self.PAINTING_CONFIG.get('proximity_multiplier', 1.5)
+        
+        # Only nearby meshes in the same body region if we know the region (unrecognised
+        # mesh names have no region, so they never count as 'unknown')
+        if body_region != 'unknown':
+            candidate_indices = np.array(self._mesh_indices_by_region.get(body_region, ()), dtype=np.intp)
+            candidate_indices = candidate_indices[nearby[candidate_indices]]
+        else:
+            candidate_indices = np.flatnonzero(nearby)
+        
+        for i in candidate_indices:
+            # Skip if it's the target mesh or already in our specific list
+            mesh = mesh_cache[i]
+            if i in specific_indices or mesh.name == target_obj.name:
+                continue
+            
+            # Skip meshes that match exclusion terms
+            if exclusion_pattern and exclusion_pattern.search(mesh.name_lower):
+                logger.debug("Excluding mesh '%s' due to exclusion terms", mesh.name)
+                continue
+            
+            # Additional filtering: Check if the mesh name has some similarity to the body part
+            if body_part:
+                # Check for direct word matches
+                has_match = bool(word_pattern and word_pattern.search(mesh.name_lower))
                 
-                # Check if object is close enough
-                if distance < threshold:
-                    # Additional filtering: Check if the mesh name has some similarity to the body part
-                    if body_part:
-                        obj_name_lower = obj.name.lower()
-                        body_part_words = body_part.split()
-                        
-                        # Check for direct word matches
-                        has_match = False
-                        for word in body_part_words:
-                            if len(word) > 3 and word in obj_name_lower:
-                                has_match = True
-                                break
-                        
-                        if not has_match:
-                            # Check for character similarity as a fallback
-                            body_part_chars = set(body_part.replace(" ", ""))
-                            obj_name_chars = set(obj_name_lower.replace(" ", ""))
-                            similarity = len(body_part_chars.intersection(obj_name_chars)) / len(body_part_chars)
-                            
-                            if similarity < 0.3:  # Less than 30% character overlap
-                                continue
+                if not has_match:
+                    # Check for character similarity as a fallback
+                    similarity = bin(body_part_bits & mesh.char_bits).count('1') / body_part_char_count
                     
-                    additional_outer_meshes.append((obj.name, distance))
-        
-        # Sort by distance (closest first)
-        additional_outer_meshes.sort(key=lambda x: x[1])
+                    if similarity < 0.3:  # Less than 30% character overlap
+                        continue
+            
+            # Visibility last: it is the only live Blender property read
+            if not mesh.obj.hide_viewport:
+                additional_outer_meshes.append(i)
         
-        # Extract just the mesh names
-        additional_outer_mesh_names = [mesh[0] for mesh in additional_outer_meshes]
+        # Sort by distance (closest first) and extract just the mesh names
+        additional_outer_mesh_names = self._names_by_distance(mesh_cache, additional_outer_meshes, distances)
         
         # Combine specific and additional outer meshes, prioritizing specific ones
         combined_outer_mesh_names = specific_outer_mesh_names + additional_outer_mesh_names
@@ -1086,6 +1337,15 @@ class InjuryVisualizer:
         print(f"Found {len(combined_outer_mesh_names)} total outer meshes for {muscle_name}")
         return combined_outer_mesh_names
 
+    @staticmethod
+    def _names_by_distance(mesh_cache, indices, distances):
+        """Names of the given mesh_cache entries, closest first (ties keep their order)"""
+        if not indices:
+            return []
+        indices = np.array(indices)
+        order = indices[np.argsort(distances[indices], kind='stable')]
+        return [mesh_cache[i].name for i in order]
+
     def process_injury_data(self, injury_data, use_xray=None):
         """
         Process injury data and apply visualizations with AI-enhanced mesh detection.
@@ -1113,6 +1373,9 @@ class InjuryVisualizer:
             self.reset_visualization()
             self.processed_body_parts = set()  # Clear the set of processed body parts
             
+            # Snapshot mesh names, regions and transforms once for all injuries
+            self._build_mesh_cache()
+            
             # First, apply x-ray effect (always enabled)
             print("Applying x-ray effect to model...")
             self.apply_xray_effect()
@@ -1131,7 +1394,7 @@ class InjuryVisualizer:
                     continue
                     
                 # Create a unique key for this injury
-                injury_key = f"{body_part}_{side}"
+                injury_key = (body_part, side)
                 
                 # Only add if not already processed
                 if injury_key not in processed_keys:
@@ -1204,21 +1467,15 @@ class InjuryVisualizer:
                 return False
             
             # Check for duplicate injuries - use a combination of body part and side as a unique key
-            injury_key = f"{body_part}_{side}"
+            injury_key = (body_part, side)
             if injury_key in self.processed_body_parts:
                 print(f"Skipping duplicate injury for {body_part} ({side})")
                 return True  # Return success to avoid counting as failure
             
             # Get appropriate color for this injury based on status
-            if status == 'active':
-                color = self.INJURY_COLORS['active']
-                print(f"Using ACTIVE color (RED) for {body_part}")
-            elif status == 'past':
-                color = self.INJURY_COLORS['past']
-                print(f"Using PAST color (ORANGE) for {body_part}")
-            elif status == 'recovered':
-                color = self.INJURY_COLORS['recovered']
-                print(f"Using RECOVERED color (GREEN) for {body_part}")
+            color = self.INJURY_COLORS.get(status)
+            if color is not None:
+                print(f"Using {self._INJURY_COLOR_LABELS[status]} for {body_part}")
             else:
                 # Default to active if unknown status
                 color = self.INJURY_COLORS['active']
@@ -1232,11 +1489,11 @@ class InjuryVisualizer:
                 
                 # As a fallback, try to find any mesh that contains the body part name
                 fallback_meshes = []
-                for obj in bpy.data.objects:
-                    if obj.type == 'MESH':
-                        obj_name_lower = obj.name.lower()
-                        if body_part in obj_name_lower and self.is_mesh_on_side(obj.name, side):
-                            fallback_meshes.append(obj)
+                mesh_cache = self._get_mesh_cache()
+                on_side = self._get_side_mask(side)
+                for i, mesh in enumerate(mesh_cache):
+                    if body_part in mesh.name_lower and on_side[i]:
+                        fallback_meshes.append(mesh.obj)
                 
                 if fallback_meshes:
                     print(f"Found {len(fallback_meshes)} fallback meshes containing '{body_part}'")
@@ -1265,7 +1522,6 @@ class InjuryVisualizer:
             
         except Exception as e:
             print(f"Error processing single injury: {str(e)}")
-            import traceback
             traceback.print_exc()
             return False
     
@@ -1275,11 +1531,19 @@ class InjuryVisualizer:
             print("Resetting visualization...")
             
             # Restore original materials
-            for obj_name, material in self.original_materials.items():
+            for obj_name, materials in self.original_materials.items():
                 obj = bpy.data.objects.get(obj_name)
                 if obj and obj.type == 'MESH':
-                    for i in range(len(obj.material_slots)):
-                        obj.material_slots[i].material = material
+                    if len(obj.material_slots) == len(materials):
+                        # Only write slots that were actually repainted, each write tags the object for update
+                        for slot, material in zip(obj.material_slots, materials):
+                            if slot.material != material:
+                                slot.material = material
+                    else:
+                        # A slot was added to a mesh that had none; rebuild the slot list
+                        obj.data.materials.clear()
+                        for material in materials:
+                            obj.data.materials.append(material)
             
             # Restore original visibility
             for obj_name, visibility in self.original_visibility.items():
@@ -1292,10 +1556,19 @@ class InjuryVisualizer:
 
         except Exception as e:
             print(f"ERROR: Failed to reset visualization: {str(e)}")
-            import traceback
             traceback.print_exc()
             return False
 
+    def _remove_unused_images(self):
+        """Remove image datablocks nothing references, so the glTF exporter does not walk them"""
+        removed = 0
+        for image in list(bpy.data.images):
+            if image.users == 0:
+                bpy.data.images.remove(image)
+                removed += 1
+        if removed:
+            print(f"Removed {removed} unused images before export")
+    
     def export_visualization(self, output_path):
         """Export the visualization to the specified output path."""
         try:
@@ -1336,7 +1609,6 @@ class InjuryVisualizer:
             
         except Exception as e:
             print(f"Error exporting visualization: {str(e)}")
-            import traceback
             traceback.print_exc()
             return False
 
@@ -1352,25 +1624,42 @@ class InjuryVisualizer:
             file_ext = os.path.splitext(output_path)[1].lower()
             print(f"Detected file format: {file_ext}")
             
-            # Select all mesh objects
-            bpy.ops.object.select_all(action='DESELECT')
+            # Select exactly the mesh objects in one pass, without the select_all operator
             mesh_count = 0
-            for obj in bpy.context.scene.objects:
-                if obj.type == 'MESH':
-                    obj.select_set(True)
-                    mesh_count += 1
+            for obj in bpy.context.view_layer.objects:
+                is_mesh = obj.type == 'MESH'
+                obj.select_set(is_mesh)
+                mesh_count += is_mesh
             print(f"Selected {mesh_count} mesh objects for export")
             
             if file_ext == '.glb':
                 # Export as GLB with simplified options
                 print("Using GLB export format with simplified options")
+                self._remove_unused_images()
                 try:
-                    # Try with minimal options first
-                    bpy.ops.export_scene.gltf(
-                        filepath=output_path,
-                        use_selection=True,
-                        export_format='GLB'
-                    )
+                    try:
+                        # Skip the image, animation and scene-extras pipelines; only meshes and material colors are needed
+                        bpy.ops.export_scene.gltf(
+                            filepath=output_path,
+                            use_selection=True,
+                            export_format='GLB',
+                            export_image_format='NONE',
+                            export_materials='EXPORT',
+                            export_apply=False,
+                            export_skins=False,
+                            export_animations=False,
+                            export_cameras=False,
+                            export_lights=False,
+                            use_mesh_edges=False,
+                            use_mesh_vertices=False
+                        )
+                    except TypeError:
+                        # Older exporters lack some of these options
+                        bpy.ops.export_scene.gltf(
+                            filepath=output_path,
+                            use_selection=True,
+                            export_format='GLB'
+                        )
                     print("GLB export completed successfully")
                 except Exception as e:
                     print(f"Error with GLB export: {e}")
@@ -1380,7 +1669,9 @@ class InjuryVisualizer:
                 print("Using FBX export format")
                 bpy.ops.export_scene.fbx(
                     filepath=output_path,
-                    use_selection=True
+                    use_selection=True,
+                    bake_anim=False,
+                    use_custom_props=False
                 )
             elif file_ext == '.obj':
                 # Export as OBJ with simplified options
@@ -1404,44 +1695,29 @@ class InjuryVisualizer:
             
         except Exception as e:
             print(f"Error saving model: {str(e)}")
-            import traceback
             traceback.print_exc()
             return False
 
     def _setup_camera_view(self):
         """Set up camera to view the entire model with minimal settings"""
         try:
-            # Find the bounding box of all visible objects - simplified approach
-            min_x, min_y, min_z = float('inf'), float('inf'), float('inf')
-            max_x, max_y, max_z = float('-inf'), float('-inf'), float('-inf')
-            
-            # Only check a subset of objects for better performance
-            visible_meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH' and not obj.hide_viewport]
-            
-            # If there are too many objects, sample them for better performance
-            if len(visible_meshes) > 100:
-                import random
-                visible_meshes = random.sample(visible_meshes, 100)
-            
-            for obj in visible_meshes:
-                # Use object location and dimensions for faster calculation
-                loc = obj.location
-                dims = obj.dimensions
-                
-                # Calculate approximate bounds
-                min_x = min(min_x, loc.x - dims.x/2)
-                min_y = min(min_y, loc.y - dims.y/2)
-                min_z = min(min_z, loc.z - dims.z/2)
-                max_x = max(max_x, loc.x + dims.x/2)
-                max_y = max(max_y, loc.y + dims.y/2)
-                max_z = max(max_z, loc.z + dims.z/2)
+            # Find the bounding box of all visible objects from their world-space bound_box
+            # corners (correct for rotated and off-center meshes), reusing the per-scene boxes
+            meshes, aabb_min, aabb_max = self._get_mesh_aabbs()
+            visible = np.array([not obj.hide_viewport for obj in meshes], dtype=bool)
+            if not visible.any():
+                print("WARNING: No visible meshes to frame, keeping the current camera view")
+                return
+            
+            bounds_min = aabb_min[visible].min(axis=0)
+            bounds_max = aabb_max[visible].max(axis=0)
             
             # Calculate center and dimensions
-            center = mathutils.Vector(((min_x + max_x) / 2, (min_y + max_y) / 2, (min_z + max_z) / 2))
-            dimensions = mathutils.Vector((max_x - min_x, max_y - min_y, max_z - min_z))
+            center = mathutils.Vector(((bounds_min + bounds_max) / 2).tolist())
+            dimensions = bounds_max - bounds_min
             
             # Position camera
-            max_dim = max(dimensions.x, dimensions.y, dimensions.z)
+            max_dim = float(dimensions.max())
             camera_distance = max_dim * 2.0  # Adjust this multiplier as needed
             
             # Position camera in front of the model
@@ -1463,7 +1739,6 @@ class InjuryVisualizer:
             
         except Exception as e:
             print(f"ERROR: Failed to set up camera view: {str(e)}")
-            import traceback
             traceback.print_exc()
 
     def _get_mesh_names_for_body_part(self, body_part):
@@ -1474,26 +1749,19 @@ class InjuryVisualizer:
         try:
             body_part = body_part.lower()
             
-            # Get all mesh names in the scene
-            mesh_names = [obj.name for obj in bpy.data.objects if obj.type == 'MESH']
+            # Get all mesh names in the scene (and their lower-cased forms) from the snapshot
+            mesh_cache = self._get_mesh_cache()
+            mesh_names = [mesh.name for mesh in mesh_cache]
             
             # Try AI-based mesh detection first if available
             if hasattr(self, 'ai_service') and self.ai_service:
                 try:
                     # Extract side information if present in the body part
                     side = None
-                    if '_left' in body_part:
-                        side = 'left'
-                        body_part = body_part.replace('_left', '')
-                    elif '_right' in body_part:
-                        side = 'right'
-                        body_part = body_part.replace('_right', '')
-                    elif 'left_' in body_part:
-                        side = 'left'
-                        body_part = body_part.replace('left_', '')
-                    elif 'right_' in body_part:
-                        side = 'right'
-                        body_part = body_part.replace('right_', '')
+                    affix = self._BODY_PART_SIDE_AFFIX.search(body_part)
+                    if affix:
+                        side = affix.group(1) or affix.group(2)
+                        body_part = body_part.replace(affix.group(), '')
                     
                     # Use AI service to find matching meshes
                     ai_matches = self.ai_service.find_matching_meshes(body_part, mesh_names, side)
@@ -1510,14 +1778,14 @@ class InjuryVisualizer:
                 mesh_patterns = self.BODY_PART_MESH_MAPPING[body_part]
                 print(f"Using traditional mapping for {body_part}: {mesh_patterns}")
                 
-                # Find matching meshes based on the patterns
+                # Find matching meshes based on the patterns, all patterns in one scan per mesh
+                patterns_re = _compile_alternation(self._BODY_PART_MESH_MAPPING_LOWER[body_part])
                 matching_meshes = []
-                for pattern in mesh_patterns:
-                    pattern_lower = pattern.lower()
-                    for mesh_name in mesh_names:
-                        if pattern_lower in mesh_name.lower():
-                            matching_meshes.append(mesh_name)
-                            print(f"Matched mesh {mesh_name} with pattern {pattern}")
+                for mesh in mesh_cache:
+                    match = patterns_re.search(mesh.name_lower)
+                    if match:
+                        matching_meshes.append(mesh.name)
+                        print(f"Matched mesh {mesh.name} with pattern {match.group()}")
                 
                 # Make sure we're not returning duplicate mesh names
                 return list(set(matching_meshes))
@@ -1525,10 +1793,7 @@ class InjuryVisualizer:
                 print(f"No mesh mapping found for body part: {body_part}")
                 
                 # Try a simple string matching as last resort
-                fallback_matches = []
-                for mesh_name in mesh_names:
-                    if body_part in mesh_name.lower():
-                        fallback_matches.append(mesh_name)
+                fallback_matches = [mesh.name for mesh in mesh_cache if body_part in mesh.name_lower]
                 
                 if fallback_matches:
                     print(f"Found fallback matches for {body_part}: {fallback_matches}")
@@ -1573,22 +1838,22 @@ class InjuryVisualizer:
             # Additional check: Skip if mesh is too large (likely a general body part)
             # This helps prevent painting large, unrelated meshes
             if not is_inner and not is_outer:
-                # Calculate volume as a rough estimate of size
-                volume = mesh_obj.dimensions.x * mesh_obj.dimensions.y * mesh_obj.dimensions.z
+                # Calculate volume as a rough estimate of size, from the mesh snapshot when available
+                mesh_info = self._mesh_info_by_name.get(mesh_name)
+                if mesh_info is not None:
+                    volume = mesh_info.volume
+                else:
+                    dimensions = mesh_obj.dimensions
+                    volume = dimensions.x * dimensions.y * dimensions.z
                 if volume > 100:  # Arbitrary threshold, adjust as needed
                     print(f"Skipping large mesh '{mesh_name}' with volume {volume:.2f}")
                     return False
             
-            # Create a new material with the color for this status
-            material_name = f"Injury_{status}_{mesh_name}"
+            # Material with the color for this status, shared by every mesh painted the same way
+            mesh_kind = 'inner' if is_inner else 'outer' if is_outer else 'surface'
+            material_name = f"Injury_{status}_{mesh_kind}"
             
             try:
-                # Try to create a new material
-                mat = bpy.data.materials.new(name=material_name)
-                
-                # Set material properties
-                mat.use_nodes = False  # Use simple material for better compatibility
-                
                 # Adjust color based on whether it's an inner or outer mesh
                 if is_inner:
                     # Inner meshes should be fully visible with injury color
@@ -1604,12 +1869,34 @@ class InjuryVisualizer:
                 
                 # Apply the alpha multiplier to the color
                 adjusted_color = (color[0], color[1], color[2], color[3] * alpha_multiplier)
-                mat.diffuse_color = adjusted_color
+                blend_method = self.PAINTING_CONFIG.get('blend_method', 'HASHED')
                 
-                # Configure material for correct display
-                mat.blend_method = self.PAINTING_CONFIG.get('blend_method', 'HASHED')
-                mat.shadow_method = 'NONE'
-                mat.use_backface_culling = False
+                # Nothing to do if the mesh already shows this color (e.g. the same payload applied again)
+                current_mat = mesh_obj.material_slots[0].material if mesh_obj.material_slots else None
+                if current_mat is not None and current_mat.blend_method == blend_method and all(
+                    abs(current - target) < 1e-6 for current, target in zip(current_mat.diffuse_color, adjusted_color)
+                ):
+                    print(f"{mesh_name} already shows the {status} injury color")
+                    return True
+                
+                # Reuse the material if an identical one was already created
+                cache_key = (status, adjusted_color, blend_method, is_inner, is_outer)
+                mat = self._injury_material_cache.get(cache_key)
+                if mat is None:
+                    # Recycle a same-named material unless it already backs another color in the cache
+                    mat = bpy.data.materials.get(material_name)
+                    if mat is None or mat in self._injury_material_cache.values():
+                        mat = bpy.data.materials.new(name=material_name)
+                    
+                    # Set material properties
+                    mat.use_nodes = False  # Use simple material for better compatibility
+                    mat.diffuse_color = adjusted_color
+                    
+                    # Configure material for correct display
+                    mat.blend_method = blend_method
+                    mat.shadow_method = 'NONE'
+                    mat.use_backface_culling = False
+                    self._injury_material_cache[cache_key] = mat
                 
                 # Assign the material to the mesh
                 try:
@@ -1657,7 +1944,6 @@ class InjuryVisualizer:
                 
         except Exception as e:
             print(f"Error applying injury to mesh {mesh_name}: {str(e)}")
-            import traceback
             traceback.print_exc()
             return False
 
@@ -1669,32 +1955,31 @@ class InjuryVisualizer:
         xray_material = self.create_xray_material()
         
         # Store original materials for all meshes if not already stored
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH' and obj.name not in self.original_materials:
+        mesh_cache = self._get_mesh_cache()
+        for mesh in mesh_cache:
+            obj = mesh.obj
+            if obj.name not in self.original_materials:
                 self.original_materials[obj.name] = [slot.material for slot in obj.material_slots]
                 self.original_visibility[obj.name] = obj.hide_viewport
         
         # Apply x-ray material to all non-hidden meshes
         meshes_affected = 0
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH' and not obj.hide_viewport:
+        for mesh in mesh_cache:
+            obj = mesh.obj
+            if not obj.hide_viewport:
                 # Skip specific outer meshes that should remain transparent
-                skip_mesh = False
-                for outer_mesh in self.OUTER_MESHES:
-                    if outer_mesh.lower() in obj.name.lower():
-                        skip_mesh = True
-                        break
-                
-                if skip_mesh:
+                if self._OUTER_MESH_PATTERN.search(mesh.name_lower):
                     continue
                 
-                # Apply the x-ray material to all material slots
-                if obj.data.materials:
-                    for i in range(len(obj.data.materials)):
-                        obj.data.materials[i] = xray_material
+                # Apply the shared x-ray material to all material slots, writing only slots that differ
+                materials = obj.data.materials
+                if materials:
+                    for i, material in enumerate(materials):
+                        if material != xray_material:
+                            materials[i] = xray_material
                 else:
                     # No existing materials, add a new one
-                    obj.data.materials.append(xray_material)
+                    materials.append(xray_material)
                 
                 meshes_affected += 1
         
@@ -1703,16 +1988,18 @@ class InjuryVisualizer:
     
     def create_xray_material(self):
         """Create a semi-transparent x-ray material with a blueish glow."""
-        # Create a unique material name with timestamp to avoid conflicts
-        material_name = f"XRay_Material_{time.time()}"
+        # One x-ray material per file; settings are re-applied below, so an existing one can be recycled
+        material_name = "XRay_Material"
         
         # Get x-ray settings from config
         xray_color = self.PAINTING_CONFIG.get('xray_color', (0.8, 0.9, 1.0, 1.0))
         xray_opacity = self.PAINTING_CONFIG.get('xray_opacity', 1.0)
         emission_strength = self.PAINTING_CONFIG.get('xray_emission_strength', 0.8)
         
-        # Create the material
-        material = bpy.data.materials.new(name=material_name)
+        # Create the material, or recycle the one from an earlier call
+        material = bpy.data.materials.get(material_name)
+        if material is None:
+            material = bpy.data.materials.new(name=material_name)
         material.use_nodes = False  # Use simpler material model for better performance
         
         # Set material properties
@@ -1742,19 +2029,17 @@ class InjuryVisualizer:
         filtered_meshes = []
         
         # Define exclusion terms based on body part
-        exclusion_terms = []
-        if 'foot' in body_part_lower or 'ankle' in body_part_lower:
-            exclusion_terms = ['hand', 'palmar', 'pollicis', 'carpal', 'carpus', 'metacarpal']
-            print(f"Filtering out hand-related meshes for foot/ankle body part")
-        elif 'hand' in body_part_lower or 'wrist' in body_part_lower:
-            exclusion_terms = ['foot', 'plantar', 'hallucis', 'tarsal', 'tarsus', 'metatarsal']
-            print(f"Filtering out foot-related meshes for hand/wrist body part")
+        exclusion_pattern = None
+        exclusions = self._resolve_exclusions(body_part_lower)
+        if exclusions:
+            exclusion_pattern, exclusion_description = exclusions[0]
+            print(f"Filtering out {exclusion_description} body part")
         
         # Filter meshes
         for mesh in meshes:
             mesh_lower = mesh.lower()
-            if exclusion_terms and any(term in mesh_lower for term in exclusion_terms):
-                print(f"  (INFO: Filtering out irrelevant mesh '{mesh}' for body part '{body_part}')")
+            if exclusion_pattern and exclusion_pattern.search(mesh_lower):
+                logger.debug("Filtering out irrelevant mesh '%s' for body part '%s'", mesh, body_part)
                 continue
             filtered_meshes.append(mesh)
         
@@ -1778,119 +2063,23 @@ class InjuryVisualizer:
         # Normalize body part name
         body_part = body_part.lower().strip()
         
-        # Create a mapping of common body parts to their exact mesh names
-        body_part_to_mesh_map = {
-            'shoulder': [
-                'Deltoid', 'Supraspinatus', 'Infraspinatus', 'Teres minor', 
-                'Subscapularis', 'Acromial part of deltoid muscle'
-            ],
-            'arm': [
-                'Biceps brachii', 'Triceps brachii', 'Brachialis', 'Brachioradialis'
-            ],
-            'foot': [
-                'Extensor digitorum brevis', 'Extensor hallucis brevis', 'Abductor hallucis',
-                'Flexor digitorum brevis', 'Abductor digiti minimi of foot'
-            ],
-            'ankle': [
-                'Tibialis anterior', 'Tibialis posterior', 'Fibularis longus', 
-                'Fibularis brevis', 'Calcaneal tendon'
-            ],
-            'knee': [
-                'Rectus femoris', 'Vastus lateralis', 'Vastus medialis', 'Vastus intermedius',
-                'Patellar retinaculum'
-            ],
-            'wrist': [
-                'Flexor carpi radialis', 'Flexor carpi ulnaris', 'Extensor carpi radialis',
-                'Extensor carpi ulnaris'
-            ],
-            'hand': [
-                'Abductor pollicis brevis', 'Opponens pollicis', 'Flexor pollicis brevis',
-                'Adductor pollicis', 'Abductor digiti minimi of hand'
-            ],
-            'neck': [
-                'Sternocleidomastoid', 'Trapezius', 'Longus colli', 'Longus capitis'
-            ],
-            'back': [
-                'Erector spinae', 'Multifidus', 'Quadratus lumborum', 'Latissimus dorsi'
-            ],
-            'hip': [
-                'Gluteus maximus', 'Gluteus medius', 'Gluteus minimus', 'Piriformis',
-                'Tensor fasciae latae'
-            ]
-        }
-        
         # Get the list of mesh names for this body part
-        target_mesh_patterns = []
+        target_mesh_patterns = self._exact_mesh_patterns(body_part)
+        print(f"Using mesh patterns for {body_part}: {list(target_mesh_patterns)}")
         
-        # First check for exact matches in our mapping
-        if body_part in body_part_to_mesh_map:
-            target_mesh_patterns = body_part_to_mesh_map[body_part]
-        else:
-            # If no exact match, check for partial matches
-            for key, patterns in body_part_to_mesh_map.items():
-                if key in body_part or body_part in key:
-                    target_mesh_patterns = patterns
-                    break
-        
-        # If still no matches, use the body part name itself as a pattern
-        if not target_mesh_patterns:
-            # Split the body part into words and use words with 4+ characters
-            words = body_part.split()
-            target_mesh_patterns = [word for word in words if len(word) >= 4]
-            
-            if not target_mesh_patterns:
-                # If still no patterns, use the whole body part name
-                target_mesh_patterns = [body_part]
-        
-        print(f"Using mesh patterns for {body_part}: {target_mesh_patterns}")
-        
-        # Find meshes that match our patterns
-        exact_meshes = []
-        for obj in bpy.data.objects:
-            if obj.type != 'MESH':
-                continue
-                
-            obj_name_lower = obj.name.lower()
-            
-            # Check if this mesh matches any of our patterns
-            for pattern in target_mesh_patterns:
-                pattern_lower = pattern.lower()
-                if pattern_lower in obj_name_lower:
-                    # Check if it's on the correct side
-                    if self.is_mesh_on_side(obj.name, side):
-                        print(f"  (INFO: Found exact match '{obj.name}' for pattern '{pattern}')")
-                        exact_meshes.append(obj)
-                        break
+        # Scored matches are computed once per body part; only the side filter runs per injury
+        exact_matches = self._get_exact_mesh_matches(body_part)
+        side_mask = self._get_side_mask(side)
+        exact_matches = [match for match in exact_matches if side_mask[match[0]]]
+        exact_meshes = [self._mesh_cache[position].obj for position, _ in exact_matches]
         
         # If we found too many meshes, limit to the most relevant ones
         if len(exact_meshes) > 5:
             print(f"  (INFO: Found {len(exact_meshes)} matches, limiting to most relevant)")
             
-            # Score each mesh based on how closely it matches the body part
-            scored_meshes = []
-            for mesh in exact_meshes:
-                score = 0
-                mesh_name_lower = mesh.name.lower()
-                
-                # Exact body part name in mesh name gets highest score
-                if body_part in mesh_name_lower:
-                    score += 10
-                
-                # Each pattern match adds to the score
-                for pattern in target_mesh_patterns:
-                    if pattern.lower() in mesh_name_lower:
-                        score += 5
-                
-                # Shorter names are likely more specific
-                score -= len(mesh_name_lower) * 0.1
-                
-                scored_meshes.append((mesh, score))
-            
-            # Sort by score (highest first)
-            scored_meshes.sort(key=lambda x: x[1], reverse=True)
-            
-            # Take the top 5
-            exact_meshes = [mesh for mesh, _ in scored_meshes[:5]]
+            # Sort by score (highest first), ties keep scene order, and take the top 5
+            exact_matches = sorted(exact_matches, key=lambda match: match[1], reverse=True)
+            exact_meshes = [self._mesh_cache[position].obj for position, _ in exact_matches[:5]]
         
         print(f"Found {len(exact_meshes)} exact meshes for {body_part}")
         return exact_meshes
@@ -1901,9 +2090,23 @@ if __name__ == "__main__":
         # Get command line arguments
         script_args = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
         
+        # Per-mesh diagnostics are logged at DEBUG; --verbose or PAINT_FBX_LOG_LEVEL turns them on
+        verbose = '--verbose' in script_args
+        if verbose:
+            script_args.remove('--verbose')
+        log_level = logging.DEBUG
+        if not verbose:
+            level_name = os.environ.get('PAINT_FBX_LOG_LEVEL', 'WARNING').upper()
+            log_level = logging.getLevelName(level_name)
+            if not isinstance(log_level, int):
+                print(f"WARNING: Unknown PAINT_FBX_LOG_LEVEL '{level_name}', using WARNING")
+                log_level = logging.WARNING
+        logging.basicConfig(level=log_level, format='%(levelname)s: %(message)s')
+        
         if len(script_args) < 3:
-            print("Usage: blender --background --python paint_fbx_model.py -- <fbx_path> <injury_json_path> <output_path> [use_xray]")
+            print("Usage: blender --background --python paint_fbx_model.py -- <fbx_path> <injury_json_path> <output_path> [use_xray] [--verbose]")
             print("  use_xray: Optional parameter. Can be 'true' or 'false' to override config")
+            print("  --verbose: Log per-mesh diagnostics (or set PAINT_FBX_LOG_LEVEL=DEBUG)")
             sys.exit(1)
             
         # Extract required arguments
@@ -1941,16 +2144,21 @@ if __name__ == "__main__":
         
         # Load injury data with error handling
         try:
-            with open(injury_json_path, 'r') as f:
-                injury_data = json.load(f)
+            # Read the bytes in one call and let the parser decode them
+            with open(injury_json_path, 'rb') as f:
+                injury_data = json.loads(f.read())
         except Exception as e:
             print(f"ERROR: Failed to load injury data from {injury_json_path}: {e}")
             sys.exit(1)
             
+        # Normalize the payload to a list of injuries once, before anything iterates it
         if not isinstance(injury_data, list):
             print(f"WARNING: Injury data is not a list. Converting...")
             if injury_data is None:
                 injury_data = []
+            elif isinstance(injury_data, dict) and isinstance(injury_data.get('injuries'), list):
+                # A report-shaped payload: {'injuries': [...], ...}
+                injury_data = injury_data['injuries']
             else:
                 injury_data = [injury_data]
         
@@ -1984,6 +2192,5 @@ if __name__ == "__main__":
         
     except Exception as e:
         print(f"CRITICAL ERROR: {str(e)}")
-        import traceback
         traceback.print_exc()
         sys.exit(1) 
\ No newline at end of file
@@ -3,15 +3,15 @@ Simplified entry point for Render deployment.
 This loads the main app and ensures it binds to the right port.
 """
 
+import importlib.util
 import os
 import sys
+import threading
 import traceback
 from flask import Flask, jsonify
-from flask_cors import CORS
 
 # Create a simple placeholder app in case imports fail
 app = Flask(__name__)
-CORS(app, resources={r"/*": {"origins": "*"}})
 
 @app.route('/')
 def health_check():
@@ -22,75 +22,89 @@ def status():
     return jsonify({
         "status": "running",
         "main_app_loaded": main_app_loaded,
+        "main_app_loading": main_app_loading,
         "error": error_details if not main_app_loaded else None,
         "version": "1.0.0",
     })
 
 # Global variables to track app status
 main_app_loaded = False
+main_app_loading = True
 error_details = None
 
-# Try to import the main app
-try:
-    print("Importing main application...")
-    # Add the current directory to the path
-    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-    
-    # First check if we need to install any missing dependencies
-    missing_deps = []
-    try:
-        import transformers
-    except ImportError:
-        print("Transformers library missing, will be installed automatically")
-        missing_deps.append("transformers>=4.28.0")
-    
-    # Install missing dependencies if needed
-    if missing_deps:
-        import subprocess
-        print(f"Installing missing dependencies: {missing_deps}")
-        subprocess.check_call([sys.executable, "-m", "pip", "install"] + missing_deps)
-        print("Dependencies installed successfully")
-    
-    # Import the app from app.py
-    from app import app as main_app
-    
-    # Import our CORS middleware
-    try:
-        from cors_middleware import apply_cors
-        
-        # Apply CORS middleware to main app if needed
-        if os.environ.get('CORS_ENABLED', 'true').lower() == 'true':
-            print("Applying enhanced CORS middleware...")
-            main_app.after_request(add_cors_headers)
-        
-    except ImportError:
-        print("CORS middleware not available, using default CORS")
-    
-    # Replace our placeholder app with the main app
-    app = main_app
-    main_app_loaded = True
-    print("Main application imported successfully!")
-except Exception as e:
-    # If the import fails, we'll keep our simple app instead
-    error_details = f"{str(e)}\n{traceback.format_exc()}"
-    print(f"Error importing main application: {str(e)}")
-    print(traceback.format_exc())
-    print("Starting with minimal placeholder app instead")
-    
-    @app.route('/error')
-    def error_details_route():
-        return f"<h1>Error loading main application</h1><pre>{error_details}</pre>"
+# CORS headers added to every response, built once at import
+_CORS_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Headers', 'Content-Type,Authorization,X-Requested-With,Accept,Origin,Range'),
+    ('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS'),
+    ('Access-Control-Expose-Headers', 'Content-Length, Content-Type, Content-Disposition, Last-Modified, Accept-Ranges, ETag'),
+)
 
 # Add CORS headers to all responses
 def add_cors_headers(response):
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization,X-Requested-With,Accept,Origin,Range')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
-    response.headers.add('Access-Control-Expose-Headers', 'Content-Length, Content-Type, Content-Disposition, Last-Modified, Accept-Ranges, ETag')
+    response.headers.extend(_CORS_HEADERS)
     return response
 
+# The placeholder app's only CORS handling (the main app brings its own)
+app.after_request(add_cors_headers)
+
 def get_app_status():
-    return "fully loaded" if main_app_loaded else "running in fallback mode"
+    if main_app_loaded:
+        return "fully loaded"
+    return "loading main application" if main_app_loading else "running in fallback mode"
+
+@app.route('/error')
+def error_details_route():
+    if error_details is None:
+        return "<h1>No error loading main application</h1>"
+    return f"<h1>Error loading main application</h1><pre>{error_details}</pre>"
+
+@app.errorhandler(404)
+def route_not_ready(error):
+    # API routes only exist once the main app is loaded; ask clients to retry instead of a 404
+    if main_app_loading:
+        response = jsonify({"error": "Service is starting up, please retry shortly"})
+        response.status_code = 503
+        response.headers['Retry-After'] = '10'
+        return response
+    return error
+
+def load_main_app():
+    """
+    Import the main app (which pulls in the whole ML stack) and route requests to it once ready.
+    Until then the placeholder app answers, so health checks pass while models load.
+    """
+    global main_app_loaded, main_app_loading, error_details
+    try:
+        print("Importing main application...")
+        # Add the current directory to the path
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        
+        # Dependencies are pinned in requirements.txt and installed at build time; only report what is
+        # missing (a spec lookup, without importing the package) instead of running pip while booting.
+        # The services fall back to non-ML summaries when transformers is unavailable.
+        if importlib.util.find_spec("transformers") is None:
+            print("WARNING: transformers is not installed; install requirements.txt to enable ML report analysis")
+        
+        # Import the app from app.py. It already sets the CORS headers on every response
+        # (Flask-CORS plus its own after_request handler), so nothing is layered on top here
+        from app import app as main_app
+        
+        # Hand every further request to the main app; the WSGI server keeps calling our app object
+        app.wsgi_app = main_app.wsgi_app
+        main_app_loaded = True
+        print("Main application imported successfully!")
+    except Exception as e:
+        # If the import fails, we'll keep our simple app instead
+        error_details = f"{str(e)}\n{traceback.format_exc()}"
+        print(f"Error importing main application: {str(e)}")
+        print(traceback.format_exc())
+        print("Continuing with minimal placeholder app instead")
+    finally:
+        main_app_loading = False
+
+# Load the main app in the background so the server binds and answers immediately
+threading.Thread(target=load_main_app, daemon=True).start()
 
 # This is only used when running directly with Python, not with Gunicorn
 if __name__ == '__main__':
@@ -3,13 +3,9 @@ set -e
 
 echo "Running startup script..."
 
-# Install required packages
+# Install required packages, including the key NLP packages, in one pip run so dependencies resolve once
 echo "Installing dependencies..."
-pip install -r requirements.txt
-
-# Install key NLP packages explicitly
-echo "Installing NLP dependencies explicitly..."
-pip install transformers>=4.28.0
+pip install -r requirements.txt "transformers>=4.28.0"
 
 # Skip the heavy import checks which were causing memory issues
 echo "Skipping import checks due to memory constraints..."